@@ -41,6 +41,10 @@ RMS_MULTIPLIER = 10  # amplify the volume reading to make it more sensitive
 VOLUME_MIN = 0.0  # quietest possible
 VOLUME_MAX = 1.0  # loudest possible
 
+# how many recent volume readings to remember (must be a power of 2 so we
+# can wrap the index with a cheap bit-mask instead of a modulo)
+VOLUME_RING_SIZE = 1024
+
 
 class AudioInputProcessor:
     """
@@ -71,7 +75,14 @@ class AudioInputProcessor:
         
         # sounddevice-specific (Linux/Windows)
         self.stream = None  # audio input stream
-        self.audio_buffer = []  # recent audio samples
+        
+        # ring buffer of recent volume readings (single producer, single consumer)
+        # the audio callback thread writes a slot and then bumps the head, the
+        # game loop only reads - so no lock is needed and nothing is allocated
+        # inside the audio callback
+        self.volume_ring = np.zeros(VOLUME_RING_SIZE, dtype=np.float32)
+        self.volume_ring_head = 0  # total number of readings written so far
+        self.peak_read_head = 0  # ring position get_peak_volume() has read up to
         
         # current readings
         self.current_pitch = 0.0
@@ -128,9 +139,14 @@ class AudioInputProcessor:
             def audio_callback(indata, frames, time, status):
                 if status:
                     logger.warning(f"Audio callback status: {status}")
-                # calculate RMS volume from audio data
-                volume = np.sqrt(np.mean(indata**2))
-                self.current_volume = float(volume)
+                # calculate RMS volume from audio data and push it into the ring
+                # (write the slot first, then publish it by bumping the head)
+                # dot(x, x) sums the squares in one C call without making a
+                # temporary squared copy of the block like indata**2 would
+                samples = indata[:, 0]
+                head = self.volume_ring_head
+                self.volume_ring[head & (VOLUME_RING_SIZE - 1)] = np.sqrt(np.dot(samples, samples) / frames)
+                self.volume_ring_head = head + 1
             
             # open input stream with default microphone
             self.stream = sd.InputStream(
@@ -218,12 +234,41 @@ class AudioInputProcessor:
         return self.current_volume
     
     def _get_volume_sounddevice(self):
-        """get volume using sounddevice (updated by callback)"""
-        # current_volume is updated by the audio callback
-        # scale it to match pyo's range
+        """get volume using sounddevice (read from the ring filled by the callback)"""
+        head = self.volume_ring_head
+        if head == 0:
+            return VOLUME_MIN  # no audio received yet
+        # newest reading, scaled to match pyo's range
+        self.current_volume = float(self.volume_ring[(head - 1) & (VOLUME_RING_SIZE - 1)])
         volume = min(VOLUME_MAX, max(VOLUME_MIN, self.current_volume * RMS_MULTIPLIER))
         return volume
     
+    def get_peak_volume(self):
+        """
+        get the loudest volume since the last call to this method
+        
+        get_volume() only sees the newest reading, so a short yell between
+        two polls can be missed. with sounddevice this looks at every audio
+        block received since the last call instead (pyo: same as get_volume)
+        """
+        if USE_PYO:
+            return self._get_volume_pyo()
+        
+        head = self.volume_ring_head
+        start = max(self.peak_read_head, head - VOLUME_RING_SIZE)
+        self.peak_read_head = head
+        if start >= head:
+            return self._get_volume_sounddevice()  # no new audio since last time
+        
+        first = start & (VOLUME_RING_SIZE - 1)
+        last = first + (head - start)
+        if last <= VOLUME_RING_SIZE:
+            peak = self.volume_ring[first:last].max()
+        else:
+            # the readings wrap around the end of the ring
+            peak = max(self.volume_ring[first:].max(), self.volume_ring[:last - VOLUME_RING_SIZE].max())
+        return min(VOLUME_MAX, max(VOLUME_MIN, float(peak) * RMS_MULTIPLIER))
+    
     def stop(self):
         """stop the audio server and release the microphone"""
         if USE_PYO and self.server is not None:
@@ -102,6 +102,10 @@ class PongGame:
         self._visual_callbacks = {}
         self._lighting_callbacks = {}
         
+        # called with the new state whenever game_state changes (e.g. the UI
+        # showing the game over screen), so nobody has to keep polling it
+        self._state_callback = None
+        
         # create the game objects
         self._init_paddles()
         self._init_ai()
@@ -340,12 +344,12 @@ class PongGame:
         
         # ball went past left paddle (player missed) - AI wins
         if ball_x < 0:
-            self.game_state = 'game_over'
+            self._set_state('game_over')
             self._trigger_callbacks('goal', player_left=False)
         
         # ball went past right paddle (AI missed) - player wins
         elif ball_x > self.field_width:
-            self.game_state = 'game_over'
+            self._set_state('game_over')
             self._trigger_callbacks('goal', player_left=True)
     
     def _trigger_callbacks(self, event_type, *args, **kwargs):
@@ -393,27 +397,38 @@ class PongGame:
     def pause(self):
         """toggle pause state (playing <-> paused)"""
         if self.game_state == 'playing':
-            self.game_state = 'paused'
+            self._set_state('paused')
         elif self.game_state == 'paused':
-            self.game_state = 'playing'
+            self._set_state('playing')
     
     def start_game(self):
         """start a new game from the menu"""
         if self.game_state == 'menu':
-            self.game_state = 'playing'
             self.reset_game()
     
     def to_menu(self):
         """return to the main menu"""
-        self.game_state = 'menu'
+        self._set_state('menu')
     
     def reset_game(self):
         """reset all game state for a new game"""
         self.score_left = 0
         self.score_right = 0
         self.bounce_count = 0
-        self.game_state = 'playing'
         self.reset_ball()
+        self._set_state('playing')
+    
+    def _set_state(self, new_state):
+        """change game_state and tell the state callback (only if it actually changed)"""
+        if new_state == self.game_state:
+            return
+        self.game_state = new_state
+        if self._state_callback:
+            self._state_callback(new_state)
+    
+    def set_state_callback(self, callback):
+        """connect a function that is called with the new state on every state change"""
+        self._state_callback = callback
     
     def set_trail_callbacks(self, trail_callback, color_change_callback):
         """connect functions to draw the ball trail"""
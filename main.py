@@ -6,10 +6,14 @@ components (audio, graphics, game logic) and runs the main game loop.
 """
 
 import wx  # wxPython - creates windows and user interface
+import numpy as np  # image arrays (the frame buffer we draw into)
 import time  # helps us track how much time passes between frames
 import sys  # system operations like exiting the program
 import logging  # records what's happening in the game (for debugging)
+import os  # reads environment variables (like PONG_NO_AUDIO)
 import platform  # tells us what operating system we're running on
+import traceback  # prints full error details when something crashes
+import threading  # lets the microphone start up while the window is built
 
 # import our custom game components
 from game.engine import PongGame  # the game rules and physics
@@ -40,9 +44,26 @@ FIELD_HEIGHT = 600
 # Windows: use 20ms to reduce flickering (50 FPS instead of 60)
 TIMER_INTERVAL_MS = 20 if platform.system() == 'Windows' else 16
 
-# maximum time jump between updates (prevents weird behavior if computer lags)
+# maximum time jump between updates (overload guard - prevents the ball from
+# teleporting if the computer stalls for a moment)
 MAX_DELTA_TIME = 0.1
 
+# the frame interval in seconds (used to plan when each frame should happen)
+FRAME_INTERVAL = TIMER_INTERVAL_MS / 1000.0
+
+# if we fall this many frames behind schedule, stop trying to catch up
+MAX_FRAMES_BEHIND = 2
+
+# stop the game loop if this many frames in a row fail
+MAX_CONSECUTIVE_FRAME_ERRORS = 10
+
+# how long to wait for the microphone to start before giving up (seconds)
+# (on machines without an audio device, startup can hang while devices are probed)
+AUDIO_STARTUP_TIMEOUT = 3.0
+
+# set PONG_NO_AUDIO=1 to skip the microphone entirely (keyboard mode only)
+NO_AUDIO = os.environ.get('PONG_NO_AUDIO', '').lower() in ('1', 'true', 'yes')
+
 setup_logging()  # start recording what happens in the game
 logger = get_logger(__name__)
 
@@ -60,8 +81,9 @@ class PongApplication:
         initialize the application - this runs when the game first starts
         sets up all the components we need: audio, graphics, game engine, etc.
         """
-        logger.info("Initializing Pong Application")
-        logger.info(f"Platform: {platform.system()} ({platform.platform()})")
+        start_time = time.perf_counter()  # measure how long startup takes
+        self._closed = False  # becomes True once on_close has cleaned up
+        logger.info("Initializing Pong Application on %s (%s)", platform.system(), platform.platform())
         
         # store the game field dimensions
         self.field_width = FIELD_WIDTH
@@ -69,13 +91,16 @@ class PongApplication:
         
         # initialize all the components (order matters - some depend on others)
         self._init_wx_app()  # create the window system
-        self._init_audio()  # set up microphone input
+        self._init_audio()  # set up microphone input (starts in the background)
         self._init_lighting()  # set up DMX lighting (optional)
         self._init_game()  # create the game engine and renderer
         self._init_ui()  # create the window and interface
+        self._finish_audio()  # wait for the microphone to be ready
         self._init_timer()  # start the game loop timer
         
-        logger.info("Application initialized successfully")
+        # one summary line instead of a log line per step (keeps startup fast)
+        logger.info("Application initialized in %.1f ms (wx/audio/lighting/game/ui/timer ready)",
+                    (time.perf_counter() - start_time) * 1000)
     
     def _init_wx_app(self):
         """create the wxPython application (the window system)"""
@@ -83,10 +108,15 @@ class PongApplication:
             # on macOS, suppress redirect to avoid autorelease pool warnings
             self.app = wx.App(redirect=False) if IS_MACOS else wx.App()
             
+            # no window in this game handles EVT_UPDATE_UI, so tell wx to skip
+            # its idle-time update-UI sweep over every window
+            wx.UpdateUIEvent.SetMode(wx.UPDATE_UI_PROCESS_SPECIFIED)
+            
             # disable macOS window restoration (prevents crash loops on reopen)
             if IS_MACOS:
                 self.app.SetExitOnFrameDelete(True)
                 # tell macOS not to restore windows after crash
+                # (imported here on purpose - this only runs once at startup)
                 try:
                     import objc  # type: ignore
                     from Foundation import NSUserDefaults  # type: ignore
@@ -95,10 +125,8 @@ class PongApplication:
                 except Exception:
                     # if Foundation not available, that's ok - continue anyway
                     pass
-            
-            logger.info("wx.App created successfully")
         except Exception as e:
-            logger.error(f"Failed to create wx.App: {e}", exc_info=True)
+            logger.error("Failed to create wx.App: %s", e, exc_info=True)
             raise
     
     def _init_audio(self):
@@ -109,46 +137,138 @@ class PongApplication:
         - loud sounds (screaming, clapping) = paddle moves up
         - quiet/silence = paddle moves down
         
+        starting the microphone can take a few hundred milliseconds, so it
+        runs on a background thread while the window is being built.
+        _finish_audio() waits for it before the game loop starts
+        
         if audio is not available, the game defaults to keyboard mode
         """
         from utils.settings import SettingsManager
         self.settings = SettingsManager()
         
+        self.audio_server = None
+        self._audio_thread = None
+        # decides between "started in time" and "abandoned" (the startup thread
+        # and _finish_audio may both get there at the same moment)
+        self._audio_lock = threading.Lock()
+        self._audio_started = False
+        self._audio_abandoned = False  # set if startup took too long
+        self._audio_done = False  # set once the startup thread has made its final decision
+        
+        if NO_AUDIO:
+            logger.info("PONG_NO_AUDIO is set - skipping audio (keyboard mode available)")
+            self.audio_input = None
+            return
+        
+        from audio.input_processor import AudioInputProcessor
+        
+        # load settings (like how sensitive the microphone should be)
+        audio_sensitivity = self.settings.get_audio_sensitivity()
+        
+        # create the audio processor that listens to your microphone
+        # (cheap - the actual microphone connection happens in _start_audio)
+        self.audio_input = AudioInputProcessor(noise_threshold=audio_sensitivity)
+        
+        self._audio_thread = threading.Thread(target=self._start_audio, args=(self.audio_input,),
+                                              name="audio-startup", daemon=True)
+        self._audio_thread.start()
+    
+    def _start_audio(self, audio_input):
+        """
+        boot the audio server and start the microphone (runs on a background thread)
+        
+        audio_input is passed in because _finish_audio clears self.audio_input
+        if we take too long - this thread then still has to release the microphone
+        """
         # start audio server (pyo on macOS, sounddevice doesn't need one)
+        server = None
         if PYO_AVAILABLE:
             try:
                 # start the audio server (this connects to your microphone)
-                self.audio_server = Server().boot()
-                self.audio_server.start()
+                server = Server().boot()
+                server.start()
                 logger.info("Audio server started (pyo)")
             except Exception as e:
-                logger.error(f"Failed to start audio server: {e}", exc_info=True)
+                logger.error("Failed to start audio server: %s", e, exc_info=True)
                 if IS_MACOS:
                     logger.error("On macOS, you may need to run: ./fix_flac.sh")
-                self.audio_server = None
+                server = None
+            
+            with self._audio_lock:
+                abandoned = self._audio_abandoned
+                if not abandoned:
+                    self.audio_server = server
+            if abandoned:
+                # the game already gave up waiting - shut the server down again
+                logger.warning("Audio server started after the startup timeout - stopping it")
+                self._stop_audio_server(server)
+                return
         else:
             # sounddevice doesn't need a server
-            self.audio_server = None
             logger.info("Using sounddevice for audio (no server needed)")
         
-        from audio.input_processor import AudioInputProcessor
-        
-        # load settings (like how sensitive the microphone should be)
-        audio_sensitivity = self.settings.get_audio_sensitivity()
+        # start listening to the microphone
+        try:
+            started = audio_input.start(server)
+        except Exception as e:
+            logger.error("Error starting audio input: %s", e)
+            started = False
         
-        # create the audio processor that listens to your microphone
-        self.audio_input = AudioInputProcessor(server=self.audio_server, noise_threshold=audio_sensitivity)
+        with self._audio_lock:
+            abandoned = self._audio_abandoned
+            if started and not abandoned:
+                self._audio_started = True
+            self._audio_done = True
         
-        # start listening to the microphone
+        if abandoned:
+            # the game already gave up waiting, and nobody else holds the server
+            # any more - release the microphone (if it started) and the server
+            logger.warning("Audio startup finished after the timeout - stopping it")
+            if started:
+                try:
+                    audio_input.stop()
+                except Exception as e:
+                    logger.error("Error stopping audio input: %s", e)
+            self._stop_audio_server(server)
+        elif not started:
+            logger.warning("Audio input failed to start - keyboard mode available")
+        else:
+            logger.info("Audio input ready")
+    
+    @staticmethod
+    def _stop_audio_server(server):
+        """stop a pyo server (does nothing if there is none)"""
+        if server is None:
+            return
         try:
-            if self.audio_input.start(self.audio_server):
-                logger.info("Audio input ready")
-            else:
-                logger.warning("Audio input failed to start - keyboard mode available")
-                self.audio_input = None
+            server.stop()
         except Exception as e:
-            logger.error(f"Error starting audio input: {e}")
+            logger.error("Error stopping audio server: %s", e)
+    
+    def _finish_audio(self):
+        """
+        wait for the background audio startup to finish
+        
+        waits at most AUDIO_STARTUP_TIMEOUT seconds. if the microphone couldn't
+        be started in time, audio input is switched off everywhere (including
+        the window, which was created meanwhile)
+        """
+        if self._audio_thread is None:
+            return  # audio was switched off
+        
+        self._audio_thread.join(AUDIO_STARTUP_TIMEOUT)
+        with self._audio_lock:
+            if not self._audio_started:
+                self._audio_abandoned = True
+                if not self._audio_done:
+                    logger.warning("Audio startup took longer than %.1fs - keyboard mode available",
+                                   AUDIO_STARTUP_TIMEOUT)
+                    # the startup thread will see it was abandoned and stop the
+                    # server and microphone itself, so on_close must not touch them
+                    self.audio_server = None
+        if self._audio_abandoned:
             self.audio_input = None
+            self.frame.audio_input = None
     
     def _init_lighting(self):
         """
@@ -163,7 +283,7 @@ class PongApplication:
             self.lighting = ArtNetController(target_ip='127.0.0.1', universe=0)
             self.lighting.connect()
         except Exception as e:
-            logger.warning(f"Failed to initialize lighting: {e}")
+            logger.warning("Failed to initialize lighting: %s", e)
             self.lighting = None
     
     def _init_game(self):
@@ -181,7 +301,17 @@ class PongApplication:
         self.game = PongGame(self.field_width, self.field_height, difficulty=difficulty)
         
         # create the renderer (the "artist" that draws everything)
-        self.renderer = Renderer(self.field_width, self.field_height, theme_name=theme)
+        # frames are drawn in RGB so the window can show them without converting
+        self.renderer = Renderer(self.field_width, self.field_height, theme_name=theme, rgb=True)
+        
+        # the image each frame is drawn into (reused every frame instead of
+        # allocating a new one 60 times per second)
+        self._frame_buffer = np.empty((self.field_height, self.field_width, 3), dtype=np.uint8)
+        
+        # look up the paddle's move functions once, so the game loop can pick
+        # one by direction (-1 = up, 0 = stop, 1 = down) without if/elif checks
+        paddle = self.game.paddle_left
+        self._paddle_actions = {-1: paddle.move_up, 0: paddle.stop, 1: paddle.move_down}
         
         # connect the game engine to the renderer so it knows when to draw trails
         self.game.set_trail_callbacks(
@@ -190,17 +320,18 @@ class PongApplication:
         )
         
         # tell the game engine to trigger visual effects when things happen
+        # (bound methods are passed directly - no wrapper lambda per call)
         self.game.set_visual_callbacks(
-            goal_flash=lambda player_left: self.renderer.trigger_goal_flash(player_left),
-            paddle_hit=lambda x, y: self.renderer.trigger_collision_particles(x, y),
-            wall_bounce=lambda x, y: self.renderer.trigger_collision_particles(x, y)
+            goal_flash=self.renderer.trigger_goal_flash,
+            paddle_hit=self.renderer.trigger_collision_particles,
+            wall_bounce=self.renderer.trigger_collision_particles
         )
         
         # if we have lighting, connect it to game events too
         if self.lighting:
             self.game.set_lighting_callbacks(
-                goal_flash=lambda player_left: self.lighting.goal_flash(player_left),
-                collision_flash=lambda: self.lighting.collision_flash()
+                goal_flash=self.lighting.goal_flash,
+                collision_flash=self.lighting.collision_flash
             )
     
     def _init_ui(self):
@@ -211,7 +342,6 @@ class PongApplication:
         menu buttons, and all the user interface elements
         """
         try:
-            logger.info("Creating main window...")
             self.frame = PongFrame(
                 self.game, 
                 self.renderer, 
@@ -220,10 +350,8 @@ class PongApplication:
                 audio_input=self.audio_input,
                 settings=self.settings
             )
-            logger.info("Main window created successfully")
         except Exception as e:
-            logger.error(f"Failed to create main window: {e}", exc_info=True)
-            import traceback
+            logger.error("Failed to create main window: %s", e, exc_info=True)
             traceback.print_exc()
             raise
     
@@ -234,12 +362,21 @@ class PongApplication:
         this timer fires 60 times per second (every 16 milliseconds)
         each time it fires, we update the game and redraw everything
         this is what makes the game animated and smooth
+        
+        the timer is one-shot: each frame schedules the next one, so if a
+        frame runs long the events don't pile up and fire in a burst later
+        
+        we use time.perf_counter() (high resolution and never jumps backwards,
+        unlike the wall clock)
         """
-        self.running = True
-        self.last_time = time.time()  # remember when we started
+        self._stopped = threading.Event()  # set once the game loop must not run any more
+        self.last_time = time.perf_counter()  # remember when we started
+        self._next_tick = self.last_time + FRAME_INTERVAL  # when the next frame is due
+        self._frame_errors = 0  # how many frames in a row have failed
+        self._still_state = None  # non-playing state whose final frame is already on screen
         self.timer = wx.Timer(self.frame)  # create the timer
         self.frame.Bind(wx.EVT_TIMER, self.on_timer, self.timer)  # connect timer to our update function
-        self.timer.Start(TIMER_INTERVAL_MS)  # start firing every 16ms
+        self.timer.Start(TIMER_INTERVAL_MS, oneShot=True)  # fire once in 16ms (on_timer re-arms it)
     
     def on_close(self):
         """
@@ -248,20 +385,31 @@ class PongApplication:
         this stops all the running systems (audio, lighting, timer)
         before the program exits. it's important to clean up properly
         so the microphone and other resources are released
+        
+        things are stopped in the reverse order they were started: first the
+        game loop (so no frame can touch audio/lighting while they shut down),
+        then lighting, then the microphone, then the audio server.
+        safe to call more than once - only the first call does anything
         """
-        self.running = False
-        self.timer.Stop()  # stop the game loop
+        if self._closed:
+            return
+        self._closed = True
         
-        # stop the microphone
-        if self.audio_input:
-            self.audio_input.stop()
+        # stop the game loop - a timer event that is already queued will see
+        # the flag and return without doing anything
+        self._stopped.set()
+        self.timer.Stop()
         
         # disconnect the lights
         if self.lighting:
             try:
                 self.lighting.disconnect()
             except Exception as e:
-                logger.error(f"Error disconnecting lighting: {e}")
+                logger.error("Error disconnecting lighting: %s", e)
+        
+        # stop the microphone
+        if self.audio_input:
+            self.audio_input.stop()
         
         # stop the audio server
         if self.audio_server:
@@ -270,6 +418,14 @@ class PongApplication:
             except:
                 pass
     
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        # usually on_close already ran when the window closed - then this does nothing
+        self.on_close()
+        return False
+    
     def on_timer(self, event):
         """
         the main game loop - this runs 60 times per second
@@ -280,53 +436,101 @@ class PongApplication:
         3. update visual effects (particles, flashes)
         4. redraw everything on screen
         """
-        if not self.running:
+        if self._stopped.is_set():
             return
         
+        current_time = time.perf_counter()
         try:
             # calculate how much time passed since the last frame
             # (this helps keep the game speed consistent even if framerate varies)
-            current_time = time.time()
             delta_time = min(current_time - self.last_time, MAX_DELTA_TIME)
             self.last_time = current_time
             
-            # if the game is playing, control the paddle
-            if self.game.game_state == 'playing':
-                # check control mode (audio or keyboard)
-                control_mode = self.settings.get_control_mode()
-                
-                if control_mode == 'keyboard':
-                    # keyboard control is handled in the frame's check_movement_keys method
-                    pass
-                elif self.audio_input:
-                    # audio control
-                    paddle_dir = self.audio_input.get_paddle_direction()
-                    if paddle_dir == -1:  # loud sound detected
-                        self.game.paddle_left.move_up()
-                    elif paddle_dir == 1:  # quiet/silence
-                        self.game.paddle_left.move_down()
-            elif self.game.game_state == 'paused':
-                self.game.paddle_left.stop()  # don't move paddle when paused
-            
-            # update visual effects (particles fade out, flashes dim, etc.)
-            self.renderer.update_effects(delta_time)
+            # grab everything we need once (faster than looking it up each time)
+            game = self.game
+            renderer = self.renderer
+            audio_input = self.audio_input
+            state = game.game_state
             
-            # update game physics (move ball, check collisions, update score)
-            self.game.update(delta_time)
-            
-            # draw everything to create the current frame
-            frame = self.renderer.render(self.game)
-            
-            # make sure we got a valid frame
-            if frame is None or frame.size == 0:
-                logger.error("Renderer returned invalid frame")
-                return
-            
-            # display the frame in the window
-            self.frame.update_display(frame)
+            # if the game is playing, control the paddle
+            if state == 'playing':
+                # keyboard control is handled by the frame's key press/release events
+                if audio_input and self.settings.get_control_mode() != 'keyboard':
+                    # audio control: loud = up (-1), quiet/silence = down (1)
+                    self._paddle_actions[audio_input.get_paddle_direction()]()
+            elif state == 'paused':
+                self._paddle_actions[0]()  # don't move paddle when paused
             
+            # window minimized or hidden: keep the game running but skip
+            # drawing a frame nobody can see
+            if self.frame.IsIconized() or not self.frame.IsShownOnScreen():
+                game.update(delta_time)
+                self._still_state = None  # redraw once the window is back
+            elif state == self._still_state:
+                # paused/game over/menu and the effects have died down, so the
+                # frame on screen is still right - nothing to update or draw
+                pass
+            else:
+                # update visual effects (particles fade out, flashes dim, etc.),
+                # update game physics (move ball, check collisions, update score)
+                # and draw everything to create the current frame
+                frame = renderer.step_and_render(game, delta_time, out=self._frame_buffer)
+                
+                # make sure we got a valid frame
+                if frame is None or frame.size == 0:
+                    raise ValueError("Renderer returned invalid frame")
+                
+                # display the frame in the window
+                self.frame.update_display(frame)
+                
+                # once nothing moves any more, stop redrawing until the state changes
+                if state != 'playing' and renderer.effects.is_idle():
+                    self._still_state = state
+                else:
+                    self._still_state = None
+            self._frame_errors = 0  # this frame worked
         except Exception as e:
-            logger.error(f"Error in game loop: {e}", exc_info=True)
+            self._on_frame_error(e)
+        
+        self._schedule_next_frame()
+    
+    def _on_frame_error(self, error):
+        """
+        handle an error in the game loop
+        
+        only the first error in a row is logged with the full traceback, so a
+        frame that keeps failing doesn't flood the log 60 times per second.
+        if it keeps failing, the game loop is stopped and the user is told
+        """
+        self._frame_errors += 1
+        if self._frame_errors == 1:
+            logger.error("Error in game loop: %s", error, exc_info=True)
+        
+        if self._frame_errors >= MAX_CONSECUTIVE_FRAME_ERRORS:
+            logger.critical("Game loop failed %d frames in a row, stopping it", self._frame_errors)
+            self._stopped.set()
+            self.timer.Stop()
+            wx.MessageBox("The game stopped because of repeated errors.\n"
+                          "See pong_game.log for details.",
+                          "Game Error", wx.OK | wx.ICON_ERROR)
+    
+    def _schedule_next_frame(self):
+        """
+        re-arm the one-shot timer for the next frame
+        
+        frames are planned on a fixed schedule (every FRAME_INTERVAL seconds),
+        so small delays are made up on the next frame instead of adding up.
+        if we fall too far behind (e.g. the window was dragged), we give up
+        catching up and restart the schedule from now
+        """
+        if self._stopped.is_set():
+            return
+        now = time.perf_counter()
+        self._next_tick += FRAME_INTERVAL
+        if now - self._next_tick > MAX_FRAMES_BEHIND * FRAME_INTERVAL:
+            self._next_tick = now  # too far behind - don't rush through missed frames
+        next_ms = max(1, int((self._next_tick - now) * 1000))
+        self.timer.Start(next_ms, oneShot=True)
     
     def run(self):
         """
@@ -336,25 +540,20 @@ class PongApplication:
         which keeps the window open and responding to user actions
         """
         try:
-            logger.info("Rendering initial frame...")
             # render and display the initial frame (before the game starts)
             frame = self.renderer.render(self.game)
             if frame is not None:
                 self.frame.update_display(frame)
                 self.frame.Refresh()
-            logger.info("Initial frame rendered successfully")
         except Exception as e:
-            logger.error(f"Error rendering initial frame: {e}", exc_info=True)
-            import traceback
+            logger.error("Error rendering initial frame: %s", e, exc_info=True)
             traceback.print_exc()
         
-        logger.info("Starting main event loop...")
         # start the main event loop (this keeps the window open and running)
         try:
             self.app.MainLoop()
         except Exception as e:
-            logger.error(f"Error in main loop: {e}", exc_info=True)
-            import traceback
+            logger.error("Error in main loop: %s", e, exc_info=True)
             traceback.print_exc()
 
 
@@ -367,9 +566,10 @@ def main():
         logger.info("Starting Audio-Controlled Pong Game")
         logger.info("=" * 50)
         
-        # create and run the application
-        app = PongApplication()
-        app.run()
+        # create and run the application (leaving the "with" block always
+        # cleans up, even if the main loop crashes)
+        with PongApplication() as app:
+            app.run()
         
         logger.info("Game exited normally")
     except KeyboardInterrupt:
@@ -378,8 +578,7 @@ def main():
         sys.exit(0)
     except Exception as e:
         # something went wrong - log the error and exit
-        logger.critical(f"Fatal error: {e}", exc_info=True)
-        import traceback
+        logger.critical("Fatal error: %s", e, exc_info=True)
         traceback.print_exc()
         sys.exit(1)
 
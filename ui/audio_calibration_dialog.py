@@ -18,6 +18,36 @@ logger = logging.getLogger(__name__)
 WIZARD_WIDTH = 750 if platform.system() != 'Darwin' else 650
 WIZARD_HEIGHT = 750 if platform.system() != 'Darwin' else 600
 TEST_DURATION = 3  # seconds to test each level
+STEP_PAUSE = 1.0  # seconds to show a test's result before moving on
+SAMPLE_INTERVAL_MS = 50  # how often to read the volume during a test
+
+# progress text colours for the wizard steps
+SUCCESS_COLOR = wx.Colour(0, 200, 0)  # green
+QUIET_TEST_COLOR = wx.Colour(255, 165, 0)  # orange
+LOUD_TEST_COLOR = wx.Colour(255, 0, 0)  # red
+
+# instruction text for each wizard step
+INTRO_TEXT = (
+    "This wizard will help you calibrate your microphone.\n\n"
+    "You'll need to:\n"
+    "1. Stay quiet for 3 seconds (measure background noise)\n"
+    "2. Make loud sounds for 3 seconds (scream, clap, etc.)\n\n"
+    "Click 'Start' when ready!"
+)
+QUIET_TEST_TEXT = (
+    "Step 1: Quiet Test\n\n"
+    "Stay quiet for 3 seconds...\n"
+    "Measuring background noise level..."
+)
+LOUD_TEST_TEXT = (
+    "Step 2: Loud Test\n\n"
+    "Make loud sounds for 3 seconds!\n"
+    "Scream, clap, or yell as loud as you can!"
+)
+RESULTS_TEXT = (
+    "Calibration Complete!\n\n"
+    "Your microphone has been calibrated."
+)
 
 
 class AudioCalibrationDialog(wx.Dialog):
@@ -42,9 +72,24 @@ class AudioCalibrationDialog(wx.Dialog):
         self.step = 0  # 0=intro, 1=quiet, 2=loud, 3=complete
         self.quiet_level = 0.0
         self.loud_level = 0.0
-        self.timer = None
         self.test_start_time = 0
-        self.test_samples = []
+        # running totals for the current test (no need to keep every sample:
+        # the quiet test only needs the average, the loud test only the peak)
+        self.n_samples = 0
+        self.sample_sum = 0.0
+        self.sample_max = 0.0
+        
+        # (deadline, step function) to run once the pause after a test is over
+        self._pending_transition = None
+        
+        # last values written to the volume widgets (skip updates that change nothing)
+        self._last_gauge = -1
+        self._last_volume_text = ''
+        
+        # one timer for the whole wizard, bound once (binding again on each
+        # step would stack up handlers and call on_timer several times per tick)
+        self.timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_timer, self.timer)
         
         self._init_ui()
         self.Center()
@@ -92,7 +137,7 @@ class AudioCalibrationDialog(wx.Dialog):
         progress_font.PointSize += 3
         progress_font = progress_font.Bold()
         self.progress_label.SetFont(progress_font)
-        self.progress_label.SetForegroundColour(wx.Colour(0, 200, 0))  # green
+        self.progress_label.SetForegroundColour(SUCCESS_COLOR)  # green
         main_sizer.Add(self.progress_label, 0, wx.ALL | wx.CENTER, 10)
         
         # result display (hidden initially)
@@ -121,9 +166,10 @@ class AudioCalibrationDialog(wx.Dialog):
         button_sizer.AddStretchSpacer()
         
         self.back_button = wx.Button(self, wx.ID_BACKWARD, "Back", size=(130, 45))
-        back_font = self.back_button.GetFont()
-        back_font.PointSize += 1
-        self.back_button.SetFont(back_font)
+        # Back and Cancel share one font object
+        self._side_button_font = self.back_button.GetFont()
+        self._side_button_font.PointSize += 1
+        self.back_button.SetFont(self._side_button_font)
         self.back_button.Bind(wx.EVT_BUTTON, self.on_back)
         self.back_button.Enable(False)
         button_sizer.Add(self.back_button, 0, wx.ALL, 8)
@@ -138,9 +184,7 @@ class AudioCalibrationDialog(wx.Dialog):
         button_sizer.Add(self.next_button, 0, wx.ALL, 8)
         
         self.cancel_button = wx.Button(self, wx.ID_CANCEL, "Cancel", size=(130, 45))
-        cancel_font = self.cancel_button.GetFont()
-        cancel_font.PointSize += 1
-        self.cancel_button.SetFont(cancel_font)
+        self.cancel_button.SetFont(self._side_button_font)
         self.cancel_button.Bind(wx.EVT_BUTTON, self.on_cancel)
         button_sizer.Add(self.cancel_button, 0, wx.ALL, 8)
         
@@ -156,13 +200,7 @@ class AudioCalibrationDialog(wx.Dialog):
     def _show_intro(self):
         """show the introduction step"""
         self.step = 0
-        self.instructions.SetLabel(
-            "This wizard will help you calibrate your microphone.\n\n"
-            "You'll need to:\n"
-            "1. Stay quiet for 3 seconds (measure background noise)\n"
-            "2. Make loud sounds for 3 seconds (scream, clap, etc.)\n\n"
-            "Click 'Start' when ready!"
-        )
+        self.instructions.SetLabel(INTRO_TEXT)
         self.progress_label.SetLabel("")
         self.next_button.SetLabel("Start")
         self.next_button.Enable(True)  # make sure button is enabled
@@ -173,43 +211,33 @@ class AudioCalibrationDialog(wx.Dialog):
     def _show_quiet_test(self):
         """show the quiet test step"""
         self.step = 1
-        self.instructions.SetLabel(
-            "Step 1: Quiet Test\n\n"
-            "Stay quiet for 3 seconds...\n"
-            "Measuring background noise level..."
-        )
+        self.instructions.SetLabel(QUIET_TEST_TEXT)
         self.progress_label.SetLabel("Starting test...")
-        self.progress_label.SetForegroundColour(wx.Colour(255, 165, 0))  # orange during test
+        self.progress_label.SetForegroundColour(QUIET_TEST_COLOR)  # orange during test
         self.next_button.Enable(False)
-        self.test_samples = []
-        self.test_start_time = time.time()
+        self._reset_samples()
+        self.test_start_time = time.perf_counter()
         
         # start timer to measure volume
-        self.timer = wx.Timer(self)
-        self.Bind(wx.EVT_TIMER, self.on_timer)
-        self.timer.Start(50)  # update every 50ms
+        self.timer.Start(SAMPLE_INTERVAL_MS)  # update every 50ms
         
         self.Layout()
     
     def _show_loud_test(self):
         """show the loud test step"""
         self.step = 2
-        self.instructions.SetLabel(
-            "Step 2: Loud Test\n\n"
-            "Make loud sounds for 3 seconds!\n"
-            "Scream, clap, or yell as loud as you can!"
-        )
+        if self.audio_input:
+            self.audio_input.get_peak_volume()  # start peak tracking from now
+        self.instructions.SetLabel(LOUD_TEST_TEXT)
         self.progress_label.SetLabel("Starting test...")
-        self.progress_label.SetForegroundColour(wx.Colour(255, 0, 0))  # red during loud test
+        self.progress_label.SetForegroundColour(LOUD_TEST_COLOR)  # red during loud test
         self.next_button.Enable(False)
-        self.test_samples = []
-        self.test_start_time = time.time()
+        self._reset_samples()
+        self.test_start_time = time.perf_counter()
         
-        # continue timer
-        if not self.timer or not self.timer.IsRunning():
-            self.timer = wx.Timer(self)
-            self.Bind(wx.EVT_TIMER, self.on_timer)
-            self.timer.Start(50)
+        # continue timer (normally still running from the quiet test)
+        if not self.timer.IsRunning():
+            self.timer.Start(SAMPLE_INTERVAL_MS)
         
         self.Layout()
     
@@ -217,15 +245,16 @@ class AudioCalibrationDialog(wx.Dialog):
         """show the calibration results"""
         self.step = 3
         
+        # testing is over - stop measuring
+        if self.timer.IsRunning():
+            self.timer.Stop()
+        
         # calculate optimal threshold - closer to quiet level for better responsiveness
         # using 30% of the range between quiet and loud (was 60% = midpoint * 1.2)
         range_between = self.loud_level - self.quiet_level
         threshold = self.quiet_level + (range_between * 0.30)
         
-        self.instructions.SetLabel(
-            "Calibration Complete!\n\n"
-            "Your microphone has been calibrated."
-        )
+        self.instructions.SetLabel(RESULTS_TEXT)
         
         # show results
         self.quiet_result.SetLabel(f"Quiet level: {self.quiet_level:.4f}")
@@ -239,7 +268,7 @@ class AudioCalibrationDialog(wx.Dialog):
             self.audio_input.noise_threshold = threshold
         
         self.progress_label.SetLabel("✓ Settings have been saved!")
-        self.progress_label.SetForegroundColour(wx.Colour(0, 200, 0))  # green for success
+        self.progress_label.SetForegroundColour(SUCCESS_COLOR)  # green for success
         self.next_button.SetLabel("Finish")
         self.next_button.Enable(True)
         self.next_button.Show()
@@ -249,44 +278,72 @@ class AudioCalibrationDialog(wx.Dialog):
     
     def on_timer(self, event):
         """update volume display during testing"""
-        if not self.audio_input:
+        # pausing between steps - the timer keeps running and moves on when the pause is over
+        if self._pending_transition:
+            deadline, next_step = self._pending_transition
+            if time.perf_counter() >= deadline:
+                self._pending_transition = None
+                next_step()
             return
         
-        # get current volume
-        volume = self.audio_input.get_volume()
+        if not self.audio_input:
+            return
         
-        # update display
-        self.volume_text.SetLabel(f"{volume:.4f}")
-        self.volume_bar.SetValue(int(volume * 100))
+        # get current volume (loud test: the peak since the last tick, so
+        # short sounds between two ticks aren't missed)
+        if self.step == 2:
+            volume = self.audio_input.get_peak_volume()
+        else:
+            volume = self.audio_input.get_volume()
+        
+        # update display (only when the shown value actually changes -
+        # every SetLabel/SetValue makes wx repaint the widget)
+        volume_text = f"{volume:.4f}"
+        if volume_text != self._last_volume_text:
+            self._last_volume_text = volume_text
+            self.volume_text.SetLabel(volume_text)
+        gauge = int(volume * 100)
+        if gauge != self._last_gauge:
+            self._last_gauge = gauge
+            self.volume_bar.SetValue(gauge)
         
         # collect sample
-        self.test_samples.append(volume)
+        self.n_samples += 1
+        self.sample_sum += volume
+        if volume > self.sample_max:
+            self.sample_max = volume
         
         # check if test is complete
-        elapsed = time.time() - self.test_start_time
+        elapsed = time.perf_counter() - self.test_start_time
         remaining = TEST_DURATION - elapsed
         
         if remaining > 0:
-            # show timer with visual countdown
-            self.progress_label.SetLabel(f"⏱ Time remaining: {remaining:.1f}s")
+            # show timer with visual countdown (changes every tenth of a second)
+            progress_text = f"⏱ Time remaining: {remaining:.1f}s"
+            if progress_text != self.progress_label.GetLabel():
+                self.progress_label.SetLabel(progress_text)
             self.progress_label.Show()  # ensure it's visible
         else:
-            # test complete
-            self.timer.Stop()
-            
+            # test complete (pause a moment to show the result before the next step)
             if self.step == 1:
                 # quiet test complete
-                self.quiet_level = sum(self.test_samples) / len(self.test_samples)
+                self.quiet_level = self.sample_sum / self.n_samples if self.n_samples else 0.0
                 logger.info(f"Quiet level measured: {self.quiet_level}")
                 self.progress_label.SetLabel(f"✓ Quiet level: {self.quiet_level:.4f}")
-                wx.CallLater(1000, self._show_loud_test)  # pause before next step
+                self._pending_transition = (time.perf_counter() + STEP_PAUSE, self._show_loud_test)
             
             elif self.step == 2:
                 # loud test complete
-                self.loud_level = max(self.test_samples)  # use max for loud level
+                self.loud_level = self.sample_max  # use max for loud level
                 logger.info(f"Loud level measured: {self.loud_level}")
                 self.progress_label.SetLabel(f"✓ Loud level: {self.loud_level:.4f}")
-                wx.CallLater(1000, self._show_results)  # pause before showing results
+                self._pending_transition = (time.perf_counter() + STEP_PAUSE, self._show_results)
+    
+    def _reset_samples(self):
+        """clear the running totals before a new test"""
+        self.n_samples = 0
+        self.sample_sum = 0.0
+        self.sample_max = 0.0
     
     def on_next(self, event):
         """handle next/start/finish button"""
@@ -307,7 +364,8 @@ class AudioCalibrationDialog(wx.Dialog):
     
     def on_cancel(self, event):
         """handle cancel button"""
-        if self.timer and self.timer.IsRunning():
+        if self.timer.IsRunning():
             self.timer.Stop()
+        self._pending_transition = None
         self.EndModal(wx.ID_CANCEL)
 
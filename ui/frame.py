@@ -1,8 +1,12 @@
 import wx
 import cv2
+import numpy as np
 import logging
 import platform
+import time
+from contextlib import contextmanager
 
+from utils.high_scores import HighScoreManager
 from .settings_dialog import SettingsDialog
 
 logger = logging.getLogger(__name__)
@@ -11,15 +15,89 @@ GAME_WIDTH = 800
 GAME_HEIGHT = 600
 FRAME_WIDTH = 4
 PADDING = 20
+SYSTEM = platform.system()  # looked up once at import
+IS_LINUX = SYSTEM == 'Linux'
 TITLE_BAR_HEIGHT_MACOS = 40
 TITLE_BAR_HEIGHT_LINUX = 50  # Linux needs more space for window decorations
 TITLE_BAR_HEIGHT_WINDOWS = 40
 AUDIO_VIZ_HEIGHT_MACOS = 50  # height of audio visualization bar on macOS
 AUDIO_VIZ_HEIGHT_LINUX = 100  # Linux needs more height for audio viz
-KEY_TIMER_INTERVAL_MS = 50
+# (title bar height, audio viz height, extra width) for each platform
+# (Linux/Windows need more space for font rendering)
+PLATFORM_DIMENSIONS = {
+    'Darwin': (TITLE_BAR_HEIGHT_MACOS, AUDIO_VIZ_HEIGHT_MACOS, 0),
+    'Linux': (TITLE_BAR_HEIGHT_LINUX, AUDIO_VIZ_HEIGHT_LINUX, 100),
+    'Windows': (TITLE_BAR_HEIGHT_WINDOWS, AUDIO_VIZ_HEIGHT_MACOS, 100),
+}
+UI_POLL_INTERVAL = 0.05  # seconds between mic level updates
+UI_IDLE_POLL_INTERVAL = 0.5  # same, while paused or game over (nothing to move or hear)
 TOP_SCORES_COUNT = 5
 MAX_NAME_DISPLAY_LENGTH = 15
 
+# colors shared by all the panels (wx.Colour objects are created once, here)
+PANEL_BG_COLOR = wx.Colour(40, 40, 40)
+MENU_BG_COLOR = wx.Colour(30, 30, 30)
+OVERLAY_BG_COLOR = wx.Colour(20, 20, 20)
+DISPLAY_BG_COLOR = wx.Colour(0, 0, 0)
+TITLE_COLOR = wx.Colour(255, 255, 255)
+HIGHLIGHT_COLOR = wx.Colour(255, 215, 0)
+TEXT_COLOR = wx.Colour(200, 200, 200)
+VIZ_ACTIVE_COLOR = wx.Colour(0, 255, 0)  # mic level bar when above the noise threshold
+VIZ_IDLE_COLOR = wx.Colour(100, 100, 100)  # mic level bar when below it
+
+_COLOUR_CACHE = {}  # RGB tuple -> wx.Colour, filled as themes are applied
+
+
+def get_colour(rgb):
+    """return a shared wx.Colour for an (r, g, b) tuple, creating it only once"""
+    rgb = tuple(rgb)
+    colour = _COLOUR_CACHE.get(rgb)
+    if colour is None:
+        colour = _COLOUR_CACHE[rgb] = wx.Colour(*rgb)
+    return colour
+
+
+class VideoPanel(wx.Panel):
+    """panel that shows game frames by painting one reused bitmap"""
+    
+    def __init__(self, parent, width, height):
+        super().__init__(parent, size=(width, height))
+        # the bitmap covers the whole panel, so never erase the background
+        self.SetBackgroundStyle(wx.BG_STYLE_PAINT)
+        
+        # one bitmap reused for every frame: new pixels are copied into it in place
+        self._bitmap = None
+        self._rgb_buffer = None
+        self._bitmap_size = None  # (width, height) of the bitmap, kept here so wx isn't asked every frame
+        self._ensure_bitmap(width, height)
+        
+        self.Bind(wx.EVT_PAINT, self.on_paint)
+    
+    def show_frame(self, frame, rgb=True):
+        """copy a frame into the bitmap and repaint (BGR frames are converted first)"""
+        height, width = frame.shape[:2]
+        self._ensure_bitmap(width, height)
+        if not rgb:
+            # convert into the reused RGB buffer (no new array per frame)
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buffer)
+        self._bitmap.CopyFromBuffer(frame, wx.BitmapBufferFormat_RGB)
+        self.Refresh(eraseBackground=False)
+    
+    def on_paint(self, event):
+        """draw the current frame bitmap"""
+        dc = wx.BufferedPaintDC(self)
+        # plain 24-bit copy: no mask, so no alpha blending
+        dc.DrawBitmap(self._bitmap, 0, 0, useMask=False)
+    
+    def _ensure_bitmap(self, width, height):
+        """(re)create the bitmap and the RGB buffer if the frame size changed"""
+        if (width, height) == self._bitmap_size:
+            return
+        self._bitmap_size = (width, height)
+        self._bitmap = wx.Bitmap(width, height, 24)
+        self._rgb_buffer = np.zeros((height, width, 3), dtype=np.uint8)
+        self._bitmap.CopyFromBuffer(self._rgb_buffer, wx.BitmapBufferFormat_RGB)
+
 
 class PongFrame(wx.Frame):
     def __init__(self, game, renderer, on_close_callback=None, 
@@ -28,26 +106,16 @@ class PongFrame(wx.Frame):
         self.game_height = GAME_HEIGHT
         self.frame_width = FRAME_WIDTH
         
-        # platform-specific dimensions (Linux/Windows need more space for font rendering)
-        if platform.system() == 'Darwin':
-            title_bar_height = TITLE_BAR_HEIGHT_MACOS
-            audio_viz_height = AUDIO_VIZ_HEIGHT_MACOS
-            extra_width = 0  # macOS is fine as is
-        elif platform.system() == 'Linux':
-            title_bar_height = TITLE_BAR_HEIGHT_LINUX
-            audio_viz_height = AUDIO_VIZ_HEIGHT_LINUX
-            extra_width = 100  # Linux needs more width
-        else:  # Windows
-            title_bar_height = TITLE_BAR_HEIGHT_WINDOWS
-            audio_viz_height = AUDIO_VIZ_HEIGHT_MACOS
-            extra_width = 100  # Windows needs more width too
+        # platform-specific dimensions (anything unknown is treated like Windows)
+        title_bar_height, audio_viz_height, extra_width = PLATFORM_DIMENSIONS.get(
+            SYSTEM, PLATFORM_DIMENSIONS['Windows'])
         
         window_width = self.game_width + (self.frame_width * 2) + (PADDING * 2) + extra_width
         # add extra height for audio visualization bar and title bar
         window_height = self.game_height + (self.frame_width * 2) + (PADDING * 2) + title_bar_height + audio_viz_height + 20
         
         # on Linux, make window resizable to handle different DPI/scaling
-        style = wx.DEFAULT_FRAME_STYLE if platform.system() == 'Linux' else wx.DEFAULT_FRAME_STYLE & ~wx.RESIZE_BORDER
+        style = wx.DEFAULT_FRAME_STYLE if IS_LINUX else wx.DEFAULT_FRAME_STYLE & ~wx.RESIZE_BORDER
         
         super().__init__(None, title="Audio-Controlled Pong Game", 
                         size=(window_width, window_height),
@@ -62,15 +130,23 @@ class PongFrame(wx.Frame):
         self.game_mode = 'voice_ai'
         self.current_game_score = 0
         
-        from utils.high_scores import HighScoreManager
         self.high_score_manager = HighScoreManager()
+        self._scores_dirty = True  # high scores text needs (re)building
+        self._applied_theme = None  # theme the menu colors were last set from
+        
+        # fonts shared by the panels (fonts need the wx app, so they're made here;
+        # wx's font list hands back the same font object for the same settings)
+        self._title_font = wx.TheFontList.FindOrCreateFont(48, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
+        self._heading_font = wx.TheFontList.FindOrCreateFont(18, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
+        self._leaderboard_font = wx.TheFontList.FindOrCreateFont(12, wx.FONTFAMILY_TELETYPE, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
+        self._score_font = wx.TheFontList.FindOrCreateFont(32, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
         
         panel = wx.Panel(self)
-        panel.SetBackgroundColour(wx.Colour(40, 40, 40))
+        panel.SetBackgroundColour(PANEL_BG_COLOR)
         
-        # Windows: enable double buffering to reduce flickering
-        if platform.system() == 'Windows':
-            panel.SetDoubleBuffered(True)
+        # double buffering: children are drawn off-screen first, so panel
+        # switches don't flicker (on every platform, not just Windows)
+        panel.SetDoubleBuffered(True)
         
         self.panel = panel
         
@@ -79,7 +155,10 @@ class PongFrame(wx.Frame):
         self.card_sizer = wx.BoxSizer(wx.VERTICAL)
         self.menu_panel = self.create_menu_panel(panel)
         self.game_panel = self.create_game_panel(panel)
-        self.game_over_panel = self.create_game_over_panel(panel)
+        # the game over overlay is only built when the first game ends
+        self._game_over_panel = None
+        # keep the overlay covering the game panel whenever the game panel is resized
+        self.game_panel.Bind(wx.EVT_SIZE, self.on_game_panel_size)
         
         self.card_sizer.Add(self.menu_panel, 1, wx.EXPAND)
         self.card_sizer.Add(self.game_panel, 1, wx.EXPAND)
@@ -87,57 +166,51 @@ class PongFrame(wx.Frame):
         main_sizer.Add(self.card_sizer, 1, wx.EXPAND | wx.ALL, PADDING)
         panel.SetSizer(main_sizer)
         
-        self.game_over_panel.Reparent(self.game_panel)
-        self.game_over_panel.SetPosition((0, 0))
-        self.game_over_panel.SetSize(self.game_panel.GetSize())
-        
         self.Centre()
         self.show_menu_panel()
         
         self.Bind(wx.EVT_CLOSE, self.on_close)
+        self._init_key_handlers()
         self.Bind(wx.EVT_CHAR_HOOK, self.on_key)
-        
-        # keyboard control state (for Linux/Windows where GetKeyState doesn't work)
-        self.keyboard_up_pressed = False
-        self.keyboard_down_pressed = False
-        self.use_key_events = platform.system() == 'Linux'  # Linux needs event-based input
-        
-        self.key_timer = wx.Timer(self)
-        self.Bind(wx.EVT_TIMER, self.check_movement_keys, self.key_timer)
-        self.key_timer.Start(KEY_TIMER_INTERVAL_MS)
+        # key releases don't travel up to the frame like presses do, but every
+        # event ends up at the app object, so listen for them there
+        wx.GetApp().Bind(wx.EVT_KEY_UP, self.on_key_up)
+        # keys released while another window is active never send a key up
+        self.Bind(wx.EVT_ACTIVATE, self.on_activate)
+        self.game.set_state_callback(self.on_game_state_change)
+        
+        # the mic level display is updated from update_display (once per game
+        # frame, at most every UI_POLL_INTERVAL), so the frame doesn't need a timer
+        self._next_ui_poll = 0.0
+        
+        # keyboard control: movement keys held right now, as a 2-bit number
+        # (bit 0 = up, bit 1 = down), kept up to date by key press/release events
+        self._held_keys = 0
+        
+        # paddle action for each combination of held keys (up wins if both are held)
+        paddle = self.game.paddle_left
+        self._key_paddle_actions = (paddle.stop, paddle.move_up, paddle.move_down, paddle.move_up)
+        self._last_keys_state = None
         
         self.Show()
         self.SetFocus()
         
-        # start audio viz timer after window is shown (safer, only if audio viz exists)
-        try:
-            if hasattr(self, 'audio_viz_bar') and self.audio_viz_bar:
-                self.audio_viz_timer = wx.Timer(self)
-                self.Bind(wx.EVT_TIMER, self.update_audio_viz, self.audio_viz_timer)
-                self.audio_viz_timer.Start(50)
-                logger.info("Audio visualization timer started")
-        except Exception as e:
-            logger.error(f"Error starting audio viz timer: {e}", exc_info=True)
-            self.audio_viz_timer = None
-        
-        # apply initial theme to menu after window is shown (safer)
-        wx.CallAfter(self.apply_theme_to_menu)
+        # apply initial theme to menu now that the window is shown (directly,
+        # so the menu doesn't flash in the default colors first)
+        self.apply_theme_to_menu()
     
     def create_menu_panel(self, parent):
         menu_panel = wx.Panel(parent)
         self.menu_panel_widget = menu_panel  # store reference for theme updates
-        menu_panel.SetBackgroundColour(wx.Colour(30, 30, 30))
+        menu_panel.SetBackgroundColour(MENU_BG_COLOR)
         
-        # Windows: enable double buffering
-        if platform.system() == 'Windows':
-            menu_panel.SetDoubleBuffered(True)
+        menu_panel.SetDoubleBuffered(True)
         
         sizer = wx.BoxSizer(wx.VERTICAL)
         
         self.menu_title = wx.StaticText(menu_panel, label="PONG GAME")
-        title_font = wx.Font(48, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
-        self.menu_title.SetFont(title_font)
-        self.menu_title.SetForegroundColour(wx.Colour(255, 255, 255))
+        self.menu_title.SetFont(self._title_font)
+        self.menu_title.SetForegroundColour(TITLE_COLOR)
         sizer.Add(self.menu_title, 0, wx.ALIGN_CENTER | wx.TOP, 50)
         
         start_btn = wx.Button(menu_panel, label="START GAME", size=(200, 50))
@@ -149,15 +222,13 @@ class PongFrame(wx.Frame):
         sizer.Add(settings_btn, 0, wx.ALIGN_CENTER | wx.TOP, 20)
         
         self.high_scores_label = wx.StaticText(menu_panel, label="HIGH SCORES")
-        self.high_scores_label.SetForegroundColour(wx.Colour(255, 215, 0))
-        high_scores_font = wx.Font(18, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
-        self.high_scores_label.SetFont(high_scores_font)
+        self.high_scores_label.SetForegroundColour(HIGHLIGHT_COLOR)
+        self.high_scores_label.SetFont(self._heading_font)
         sizer.Add(self.high_scores_label, 0, wx.ALIGN_CENTER | wx.TOP, 30)
         
         self.high_scores_text = wx.StaticText(menu_panel, label="")
-        self.high_scores_text.SetForegroundColour(wx.Colour(200, 200, 200))
-        scores_font = wx.Font(12, wx.FONTFAMILY_TELETYPE, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
-        self.high_scores_text.SetFont(scores_font)
+        self.high_scores_text.SetForegroundColour(TEXT_COLOR)
+        self.high_scores_text.SetFont(self._leaderboard_font)
         sizer.Add(self.high_scores_text, 0, wx.ALIGN_CENTER | wx.TOP, 10)
         self.update_high_scores_display()
         
@@ -165,28 +236,38 @@ class PongFrame(wx.Frame):
         return menu_panel
     
     def update_high_scores_display(self):
-        self.high_score_manager.load_scores()
-        top_scores = self.high_score_manager.get_top_scores(TOP_SCORES_COUNT)
-        if top_scores:
-            scores_lines = []
-            for i, s in enumerate(top_scores):
-                rank = f"{i+1}."
-                name = s['name'][:MAX_NAME_DISPLAY_LENGTH]
-                score = s['score']
-                scores_lines.append(f"{rank:4} {name:15} {score:6}")
-            scores_text = "\n".join(scores_lines)
-        else:
-            scores_text = "No scores yet"
-        self.high_scores_text.SetLabel(scores_text)
-        logger.info(f"Updated high scores display: {top_scores}")
+        # only a saved score can change the list, so skip the update otherwise
+        if not self._scores_dirty:
+            return
+        self._scores_dirty = False
+        
+        # the manager keeps its scores in memory and caches the formatted text
+        scores_text = self.high_score_manager.get_top_scores_text(
+            TOP_SCORES_COUNT, MAX_NAME_DISPLAY_LENGTH)
+        if self._set_label(self.high_scores_text, scores_text or "No scores yet"):
+            # the text changed size, re-center it
+            self.menu_panel_widget.Layout()
+        logger.info("Updated high scores display (%d scores)", len(self.high_score_manager.scores))
+    
+    @staticmethod
+    def _set_label(ctrl, text):
+        """set a label only if it changed (every SetLabel repaints the control), returns True if it did"""
+        if ctrl.GetLabel() == text:
+            return False
+        ctrl.SetLabel(text)
+        return True
+    
+    @staticmethod
+    def _set_foreground(ctrl, color):
+        """set a text color only if it changed"""
+        if ctrl.GetForegroundColour() != color:
+            ctrl.SetForegroundColour(color)
     
     def create_game_over_panel(self, parent):
         overlay_panel = wx.Panel(parent)
-        overlay_panel.SetBackgroundColour(wx.Colour(20, 20, 20))
+        overlay_panel.SetBackgroundColour(OVERLAY_BG_COLOR)
         
-        # Windows: enable double buffering
-        if platform.system() == 'Windows':
-            overlay_panel.SetDoubleBuffered(True)
+        overlay_panel.SetDoubleBuffered(True)
         
         overlay_panel.Hide()
         
@@ -194,9 +275,8 @@ class PongFrame(wx.Frame):
         sizer.AddStretchSpacer()
         
         self.game_over_title = wx.StaticText(overlay_panel, label="GAME OVER")
-        self.game_over_title.SetForegroundColour(wx.Colour(255, 255, 255))
-        title_font = wx.Font(48, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
-        self.game_over_title.SetFont(title_font)
+        self.game_over_title.SetForegroundColour(TITLE_COLOR)
+        self.game_over_title.SetFont(self._title_font)
         sizer.Add(self.game_over_title, 0, wx.ALIGN_CENTER | wx.ALL, 10)
         
         name_container_sizer = wx.BoxSizer(wx.HORIZONTAL)
@@ -211,9 +291,8 @@ class PongFrame(wx.Frame):
         sizer.Add(name_container_sizer, 0, wx.EXPAND | wx.TOP, 30)
         
         self.game_over_score = wx.StaticText(overlay_panel, label="Score: 0")
-        self.game_over_score.SetForegroundColour(wx.Colour(200, 200, 200))
-        score_font = wx.Font(32, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
-        self.game_over_score.SetFont(score_font)
+        self.game_over_score.SetForegroundColour(TEXT_COLOR)
+        self.game_over_score.SetFont(self._score_font)
         sizer.Add(self.game_over_score, 0, wx.ALIGN_CENTER | wx.TOP, 20)
         
         button_sizer = wx.BoxSizer(wx.HORIZONTAL)
@@ -228,13 +307,23 @@ class PongFrame(wx.Frame):
         overlay_panel.SetSizer(sizer)
         return overlay_panel
     
+    @property
+    def game_over_panel(self):
+        return self._ensure_game_over_panel()
+    
+    def _ensure_game_over_panel(self):
+        """build the game over overlay (on top of the game panel) the first time it's needed"""
+        if self._game_over_panel is None:
+            self._game_over_panel = self.create_game_over_panel(self.game_panel)
+            self._game_over_panel.SetPosition((0, 0))
+            self._game_over_panel.SetSize(self.game_panel.GetSize())
+        return self._game_over_panel
+    
     def create_game_panel(self, parent):
         game_panel = wx.Panel(parent)
-        game_panel.SetBackgroundColour(wx.Colour(40, 40, 40))
+        game_panel.SetBackgroundColour(PANEL_BG_COLOR)
         
-        # Windows: enable double buffering
-        if platform.system() == 'Windows':
-            game_panel.SetDoubleBuffered(True)
+        game_panel.SetDoubleBuffered(True)
         
         outer_sizer = wx.BoxSizer(wx.VERTICAL)
         
@@ -246,17 +335,25 @@ class PongFrame(wx.Frame):
         inner_sizer.AddSpacer(self.frame_width)
         
         bitmap_panel = wx.Panel(game_panel)
-        bitmap_panel.SetBackgroundColour(wx.Colour(0, 0, 0))
+        bitmap_panel.SetBackgroundColour(DISPLAY_BG_COLOR)
         
-        # Windows: enable double buffering
-        if platform.system() == 'Windows':
-            bitmap_panel.SetDoubleBuffered(True)
+        bitmap_panel.SetDoubleBuffered(True)
+        # the frame display covers this panel completely, so erasing it first
+        # would only paint black that is immediately painted over
+        bitmap_panel.SetBackgroundStyle(wx.BG_STYLE_PAINT)
+        bitmap_panel.Bind(wx.EVT_ERASE_BACKGROUND, self.on_erase_background)
         
         bitmap_sizer = wx.BoxSizer(wx.VERTICAL)
         
-        self.display_bitmap = wx.StaticBitmap(bitmap_panel, size=(self.game_width, self.game_height))
-        self.display_bitmap.SetBackgroundColour(wx.Colour(0, 0, 0))
-        bitmap_sizer.Add(self.display_bitmap, 0, wx.CENTER)
+        # panel that paints the current frame itself (no StaticBitmap,
+        # so showing a frame doesn't swap bitmaps or erase the background)
+        self.display_panel = VideoPanel(bitmap_panel, self.game_width, self.game_height)
+        bitmap_sizer.Add(self.display_panel, 0, wx.CENTER)
+        
+        # newest frame waiting to be shown, and whether a paint is already queued
+        self._pending_frame = None
+        self._paint_scheduled = False
+        self._display_error = None  # error from the last copy to the screen, if any
         bitmap_panel.SetSizer(bitmap_sizer)
         
         inner_sizer.Add(bitmap_panel, 0, wx.CENTER)
@@ -272,17 +369,15 @@ class PongFrame(wx.Frame):
             outer_sizer.AddSpacer(5)
             
             self.audio_viz_panel = wx.Panel(game_panel)
-            self.audio_viz_panel.SetBackgroundColour(wx.Colour(30, 30, 30))
+            self.audio_viz_panel.SetBackgroundColour(MENU_BG_COLOR)
 
-            # Windows: enable double buffering
-            if platform.system() == 'Windows':
-                self.audio_viz_panel.SetDoubleBuffered(True)
+            self.audio_viz_panel.SetDoubleBuffered(True)
 
             viz_sizer = wx.BoxSizer(wx.HORIZONTAL)
             viz_sizer.AddStretchSpacer()
             
             viz_label = wx.StaticText(self.audio_viz_panel, label="Mic Level:")
-            viz_label.SetForegroundColour(wx.Colour(200, 200, 200))
+            viz_label.SetForegroundColour(TEXT_COLOR)
             viz_font = viz_label.GetFont()
             viz_font.PointSize += 1
             viz_label.SetFont(viz_font)
@@ -293,7 +388,7 @@ class PongFrame(wx.Frame):
             viz_sizer.Add(self.audio_viz_bar, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 8)
             
             self.audio_viz_text = wx.StaticText(self.audio_viz_panel, label="0.00")
-            self.audio_viz_text.SetForegroundColour(wx.Colour(200, 200, 200))
+            self.audio_viz_text.SetForegroundColour(TEXT_COLOR)
             viz_text_font = self.audio_viz_text.GetFont()
             viz_text_font.PointSize += 1
             self.audio_viz_text.SetFont(viz_text_font)
@@ -302,8 +397,13 @@ class PongFrame(wx.Frame):
             viz_sizer.AddStretchSpacer()
             
             self.audio_viz_panel.SetSizer(viz_sizer)
+            
+            # last values shown, so unchanged ones aren't set again
+            self._last_viz_value = 0
+            self._last_viz_text = "0.00"
+            self._last_viz_active = None
             # platform-specific audio viz panel height
-            if platform.system() == 'Linux':
+            if IS_LINUX:
                 self.audio_viz_panel.SetMinSize((-1, 70))  # taller on Linux
             else:
                 self.audio_viz_panel.SetMinSize((-1, 40))
@@ -311,102 +411,113 @@ class PongFrame(wx.Frame):
 
             logger.info("Audio visualization widget created")
         except Exception as e:
-            logger.error(f"Error creating audio viz widget: {e}", exc_info=True)
+            logger.error("Error creating audio viz widget: %s", e, exc_info=True)
             self.audio_viz_panel = None
             self.audio_viz_bar = None
             self.audio_viz_text = None
         
-        # timer to update audio visualization (will start after window is shown)
-        self.audio_viz_timer = None
-        
         game_panel.SetSizer(outer_sizer)
         return game_panel
     
-    def show_menu_panel(self):
-        self.menu_panel.Show()
-        self.game_panel.Hide()
-        self.game_over_panel.Hide()
-        
-        # Windows: freeze/thaw to prevent flickering during layout
-        if platform.system() == 'Windows':
-            self.panel.Freeze()
-        
-        self.panel.Layout()
-        
-        if platform.system() == 'Windows':
+    def _focus_frame(self):
+        """give the frame keyboard focus (skipped if it already has it - avoids focus event churn)"""
+        if wx.Window.FindFocus() is not self:
+            self.SetFocus()
+    
+    @contextmanager
+    def _frozen(self):
+        """freeze the main panel so a batch of show/hide/layout calls paints only once"""
+        self.panel.Freeze()
+        try:
+            yield
+        finally:
             self.panel.Thaw()
-        
-        # apply theme when showing menu (in case it changed during gameplay)
-        wx.CallAfter(self.apply_theme_to_menu)
+    
+    def show_menu_panel(self):
+        with self._frozen():
+            # Show()/Hide() return True only if visibility changed; lay out only then
+            # (| instead of "or" so both calls always run)
+            if self.menu_panel.Show() | self.game_panel.Hide():
+                self.panel.Layout()
+            if self._game_over_panel is not None:
+                self._game_over_panel.Hide()
+        self._bitmap_visible = False
     
     def show_game_panel(self):
-        self.menu_panel.Hide()
-        self.game_panel.Show()
-        self.game_over_panel.Hide()
-        self.panel.Layout()
-        if self.game_over_panel.GetParent() == self.game_panel:
-            self.game_over_panel.SetSize(self.game_panel.GetSize())
+        with self._frozen():
+            if self.menu_panel.Hide() | self.game_panel.Show():
+                self.panel.Layout()
+            if self._game_over_panel is not None:
+                self._game_over_panel.Hide()
+        self._bitmap_visible = True
+    
+    def on_game_panel_size(self, event):
+        """resize the overlay along with the game panel"""
+        if self._game_over_panel is not None:
+            self._game_over_panel.SetSize(event.GetSize())
+        event.Skip()
     
     def show_game_over_panel(self):
         if not self.game_panel.IsShown():
             self.show_game_panel()
         
-        game_panel_size = self.game_panel.GetSize()
-        self.game_over_panel.SetSize(game_panel_size)
-        self.game_over_panel.SetPosition((0, 0))
         self.game_over_panel.Show()
+        self._bitmap_visible = False
         self.game_over_panel.Raise()
-        self.game_over_panel.Update()
-        self.game_over_panel.SetFocus()
-        self.game_panel.Refresh()
-        self.Refresh()
-        self.Update()
+        self.game_over_panel.Layout()
     
     def on_start_game(self, event):
-        if hasattr(self, '_game_over_handled'):
-            delattr(self, '_game_over_handled')
-        
         self.game_mode = 'voice_ai'
         self.game.start_game()
         self.show_game_panel()
-        self.SetFocus()
+        self._focus_frame()
+    
+    def on_game_state_change(self, state):
+        """called by the game whenever its state changes (instead of polling it)"""
+        if state == 'game_over':
+            # let the current game update finish before touching the UI
+            wx.CallAfter(self.check_game_over)
+        elif state == 'playing':
+            # back to the fast mic poll right away instead of after the idle wait,
+            # and re-send the held keys (the paddle was stopped while not playing)
+            self._next_ui_poll = 0.0
+            self._last_keys_state = None
+            self.move_paddle_from_keys()
+        if state != 'playing':
+            # show "--" on the mic level right away: the game loop stops calling
+            # update_display once a paused/game over frame has settled
+            self.update_audio_viz()
     
     def check_game_over(self):
-        if self.game.game_state == 'game_over' and not hasattr(self, '_game_over_handled'):
-            self._game_over_handled = True
-            score = self.game.bounce_count
-            self.current_game_score = score
-            is_high_score = self.high_score_manager.is_high_score(score)
-            wx.CallAfter(self._show_game_over_overlay, score, is_high_score)
-        elif self.game.game_state != 'game_over':
-            if hasattr(self, '_game_over_handled'):
-                self._game_over_handled = False
+        if self.game.game_state != 'game_over':
+            return
+        score = self.game.bounce_count
+        self.current_game_score = score
+        is_high_score = self.high_score_manager.is_high_score(score)
+        self._show_game_over_overlay(score, is_high_score)
     
     def _show_game_over_overlay(self, score, is_high_score):
-        if not self.game_panel.IsShown():
-            self.show_game_panel()
-        
-        self.game_over_score.SetLabel(f"Score: {score}")
-        
-        if is_high_score:
-            self.game_over_title.SetLabel("NEW HIGH SCORE!")
-            self.game_over_title.SetForegroundColour(wx.Colour(255, 215, 0))
-            self.game_over_name_entry.Show()
-            self.game_over_name_entry.SetValue("Player")
-            self.game_over_ok_btn.SetLabel("OK")
-        else:
-            self.game_over_title.SetLabel("GAME OVER")
-            self.game_over_title.SetForegroundColour(wx.Colour(255, 255, 255))
-            self.game_over_name_entry.Hide()
-            self.game_over_ok_btn.SetLabel("Main Menu")
+        with self._frozen():
+            self._ensure_game_over_panel()
+            self._set_label(self.game_over_score, f"Score: {score}")
+            
+            if is_high_score:
+                self._set_label(self.game_over_title, "NEW HIGH SCORE!")
+                self._set_foreground(self.game_over_title, HIGHLIGHT_COLOR)
+                self.game_over_name_entry.Show()
+                self.game_over_name_entry.SetValue("Player")
+                self._set_label(self.game_over_ok_btn, "OK")
+            else:
+                self._set_label(self.game_over_title, "GAME OVER")
+                self._set_foreground(self.game_over_title, TITLE_COLOR)
+                self.game_over_name_entry.Hide()
+                self._set_label(self.game_over_ok_btn, "Main Menu")
+            
+            self.show_game_over_panel()
         
-        self.show_game_over_panel()
-        self.game_over_panel.Layout()
-        self.Layout()
-        self.Refresh()
         if is_high_score:
             self.game_over_name_entry.SetFocus()
-        self.SetFocus()
+        self._focus_frame()
     
     def on_game_over_ok(self, event):
         score = self.current_game_score
@@ -415,68 +526,61 @@ class PongFrame(wx.Frame):
             name = self.game_over_name_entry.GetValue().strip()
             if not name:
                 name = "Anonymous"
-            logger.info(f"Saving high score: {name} - {score}")
+            logger.info("Saving high score: %s - %s", name, score)
             self.high_score_manager.add_score(name, score)
-            logger.info(f"High scores after save: {self.high_score_manager.scores}")
-            self.high_score_manager.load_scores()
-            logger.info(f"High scores after reload: {self.high_score_manager.scores}")
+            self._scores_dirty = True
         
         self.game_over_panel.Hide()
         self.game.to_menu()
         self.show_menu_panel()
         self.update_high_scores_display()
-        self.SetFocus()
+        self._focus_frame()
     
     def apply_theme_to_menu(self):
         """apply current theme colors to the menu panel"""
         try:
-            if not hasattr(self, 'renderer') or not self.renderer:
-                return
-            
-            if not hasattr(self, 'menu_panel_widget') or not self.menu_panel_widget:
+            if self.renderer is None:
                 return
             
             theme = self.renderer.theme
             if not theme:
                 return
             
+            # nothing to do if this theme is already applied
+            if theme is self._applied_theme:
+                return
+            
             # menu colors are already in RGB format (game colors are BGR for OpenCV)
             # no conversion needed for menu colors
             
-            # Windows: freeze during updates
-            if platform.system() == 'Windows':
-                self.menu_panel_widget.Freeze()
-            
-            # update menu background
-            bg_color = theme.get('menu_bg', (30, 30, 30))
-            if bg_color and len(bg_color) == 3:
-                self.menu_panel_widget.SetBackgroundColour(wx.Colour(bg_color[0], bg_color[1], bg_color[2]))
-            
-            # update title color
-            title_color = theme.get('menu_title', (255, 255, 255))
-            if title_color and len(title_color) == 3 and hasattr(self, 'menu_title'):
-                self.menu_title.SetForegroundColour(wx.Colour(title_color[0], title_color[1], title_color[2]))
-            
-            # update high scores label color
-            highlight_color = theme.get('menu_highlight', (255, 215, 0))
-            if highlight_color and len(highlight_color) == 3 and hasattr(self, 'high_scores_label'):
-                self.high_scores_label.SetForegroundColour(wx.Colour(highlight_color[0], highlight_color[1], highlight_color[2]))
+            # (setter, theme key, default RGB) for every themed menu widget
+            ops = (
+                (self.menu_panel_widget.SetBackgroundColour, 'menu_bg', (30, 30, 30)),
+                (self.menu_title.SetForegroundColour, 'menu_title', (255, 255, 255)),
+                (self.high_scores_label.SetForegroundColour, 'menu_highlight', (255, 215, 0)),
+                (self.high_scores_text.SetForegroundColour, 'menu_text', (200, 200, 200)),
+            )
             
-            # update scores text color
-            text_color = theme.get('menu_text', (200, 200, 200))
-            if text_color and len(text_color) == 3 and hasattr(self, 'high_scores_text'):
-                self.high_scores_text.SetForegroundColour(wx.Colour(text_color[0], text_color[1], text_color[2]))
+            # freeze while changing colors so the menu repaints once, at the end
+            # (the locker thaws again even if something below fails)
+            with wx.WindowUpdateLocker(self.menu_panel_widget):
+                for set_colour, key, default in ops:
+                    rgb = theme.get(key, default)
+                    if rgb and len(rgb) == 3:
+                        set_colour(get_colour(rgb))
             
-            # Windows: thaw and update
-            if platform.system() == 'Windows':
-                self.menu_panel_widget.Thaw()
-                self.menu_panel_widget.Update()
-            else:
+            # a new background means the whole menu has to be repainted;
+            # otherwise only the three labels changed color
+            old_theme = self._applied_theme or {}
+            if old_theme.get('menu_bg') != theme.get('menu_bg'):
                 self.menu_panel_widget.Refresh()
-            
-            self.panel.Layout()
+            else:
+                self.menu_title.Refresh()
+                self.high_scores_label.Refresh()
+                self.high_scores_text.Refresh()
+            self._applied_theme = theme
         except Exception as e:
-            logger.error(f"Error applying theme to menu: {e}", exc_info=True)
+            logger.error("Error applying theme to menu: %s", e, exc_info=True)
             # don't crash the game, just log the error
     
     def on_settings(self, event):
@@ -484,151 +588,207 @@ class PongFrame(wx.Frame):
         result = dialog.ShowModal()
         dialog.Destroy()
         
-        # theme is already applied by the dialog's on_apply/on_ok methods
+        # the dialog's on_apply/on_ok already apply a new theme; this only
+        # catches anything they missed (and returns at once if nothing changed)
+        self.apply_theme_to_menu()
     
-    def on_key(self, event):
+    def _init_key_handlers(self):
+        """
+        build the key -> handler lookup tables used by on_key
+        
+        one table per screen, so a key press is a single dict lookup
+        instead of a chain of if checks
+        """
+        up_keys = (wx.WXK_UP, ord('W'), ord('w'))
+        down_keys = (wx.WXK_DOWN, ord('S'), ord('s'))
+        # which bit of _held_keys each movement key sets
+        self._movement_key_bits = {**dict.fromkeys(up_keys, 1), **dict.fromkeys(down_keys, 2)}
+        self._game_over_keys = {wx.WXK_ESCAPE: self.on_game_over_ok}
+        self._menu_keys = {wx.WXK_ESCAPE: self._on_quit_key}
+        self._game_keys = {
+            wx.WXK_ESCAPE: self._on_menu_key,
+            wx.WXK_SPACE: self._on_pause_key,
+            ord('R'): self._on_reset_key,
+            ord('r'): self._on_reset_key,
+            **dict.fromkeys(up_keys, self._on_up_key),
+            **dict.fromkeys(down_keys, self._on_down_key),
+        }
+    
+    @staticmethod
+    def _key_code(event):
+        """the pressed key as a character code, or the special key code (arrows etc.)"""
         key = event.GetUnicodeKey()
         if key == wx.WXK_NONE:
             key = event.GetKeyCode()
+        return key
+    
+    def on_key(self, event):
+        key = self._key_code(event)
         
-        if self.game_over_panel.IsShown():
-            if key == wx.WXK_ESCAPE:
-                self.on_game_over_ok(event)
-                return
-            event.Skip()
-            return
-        
-        if self.game.game_state == 'menu':
-            if key == wx.WXK_ESCAPE:
-                self.Close()
-            else:
-                event.Skip()
-            return
+        if self._game_over_panel is not None and self._game_over_panel.IsShown():
+            handlers = self._game_over_keys
+        elif self.game.game_state == 'menu':
+            handlers = self._menu_keys
+        else:
+            handlers = self._game_keys
         
-        # handle game keys
-        if key == wx.WXK_ESCAPE:
-            self.game.to_menu()
-            self.show_menu_panel()
+        handler = handlers.get(key)
+        if handler:
+            handler(event)
+        else:
+            event.Skip()
+    
+    def _on_quit_key(self, event):
+        self.Close()
+    
+    def _on_menu_key(self, event):
+        self.game.to_menu()
+        self.show_menu_panel()
+    
+    def _on_pause_key(self, event):
+        self.game.pause()
+    
+    def _on_reset_key(self, event):
+        self.game.reset_game()
+    
+    def _on_up_key(self, event):
+        self._on_movement_key(event, 1)
+    
+    def _on_down_key(self, event):
+        self._on_movement_key(event, 2)
+    
+    def _on_movement_key(self, event, bit):
+        """arrow/WASD press (and key repeat): mark the key as held"""
+        self._held_keys |= bit
+        if self.game.game_state != 'playing':
+            event.Skip()
             return
-        
-        if key == wx.WXK_SPACE:
-            self.game.pause()
+        self.move_paddle_from_keys()
+    
+    def on_key_up(self, event):
+        """arrow/WASD release: the key isn't held any more"""
+        bit = self._movement_key_bits.get(self._key_code(event))
+        if bit:
+            self._held_keys &= ~bit
+            self.move_paddle_from_keys()
+        event.Skip()
+    
+    def on_activate(self, event):
+        """forget held keys when the window loses focus (their release goes elsewhere)"""
+        if not event.GetActive():
+            self._held_keys = 0
+            self.move_paddle_from_keys()
+        event.Skip()
+    
+    def move_paddle_from_keys(self):
+        """move the paddle for the held movement keys (keyboard control only)"""
+        if self.game.game_state != 'playing':
             return
-        
-        if key == ord('R') or key == ord('r'):
-            self.game.reset_game()
+        control_mode = self.settings.get_control_mode() if self.settings else 'audio'
+        if control_mode != 'keyboard':
             return
         
-        # handle movement keys (arrows + WASD)
-        if key in [wx.WXK_UP, wx.WXK_DOWN, ord('W'), ord('w'), ord('S'), ord('s')]:
-            if self.game.game_state == 'playing':
-                # on Linux, use key events (GetKeyState doesn't work)
-                if self.use_key_events:
-                    control_mode = self.settings.get_control_mode() if self.settings else 'audio'
-                    if control_mode == 'keyboard':
-                        if key == wx.WXK_UP or key == ord('W') or key == ord('w'):
-                            self.keyboard_up_pressed = True
-                        elif key == wx.WXK_DOWN or key == ord('S') or key == ord('s'):
-                            self.keyboard_down_pressed = True
-                    return
-                else:
-                    # macOS/Windows: handled in check_movement_keys with GetKeyState
-                    return
-        
-        event.Skip()
+        # only tell the paddle when the held keys changed
+        keys_state = self._held_keys
+        if keys_state != self._last_keys_state:
+            self._last_keys_state = keys_state
+            self._key_paddle_actions[keys_state]()
     
-    def check_movement_keys(self, event):
-        """check movement keys (arrows + WASD) for keyboard control and game over state"""
-        # check for game over
-        self.check_game_over()
-        
-        # handle keyboard controls if in keyboard mode
-        if self.game.game_state == 'playing':
-            control_mode = self.settings.get_control_mode() if self.settings else 'audio'
-            if control_mode == 'keyboard':
-                if self.use_key_events:
-                    # Linux: use key press state (GetKeyState doesn't work on GTK)
-                    if self.keyboard_up_pressed:
-                        self.game.paddle_left.move_up()
-                    elif self.keyboard_down_pressed:
-                        self.game.paddle_left.move_down()
-                    else:
-                        self.game.paddle_left.stop()
-                    
-                    # reset states (will be set again by key event if still pressed)
-                    self.keyboard_up_pressed = False
-                    self.keyboard_down_pressed = False
-                else:
-                    # macOS/Windows: use GetKeyState (polling)
-                    try:
-                        keys = wx.GetKeyState
-                        # check for up movement (arrow up or W)
-                        if keys(wx.WXK_UP) or keys(ord('W')):
-                            self.game.paddle_left.move_up()
-                        # check for down movement (arrow down or S)
-                        elif keys(wx.WXK_DOWN) or keys(ord('S')):
-                            self.game.paddle_left.move_down()
-                        else:
-                            self.game.paddle_left.stop()
-                    except Exception as e:
-                        # if GetKeyState fails, fall back to event-based
-                        logger.warning(f"GetKeyState failed, switching to event-based: {e}")
-                        self.use_key_events = True
-    
-    def update_audio_viz(self, event):
+    def update_audio_viz(self, event=None):
         """update the audio visualization widget"""
         try:
-            # check if widgets exist
-            if not hasattr(self, 'audio_viz_bar') or not self.audio_viz_bar:
+            # the widgets are None if they couldn't be created
+            if self.audio_viz_bar is None:
                 return
             
             if self.audio_input and self.game.game_state == 'playing':
                 # show audio viz during gameplay
                 volume = self.audio_input.get_volume()
-                self.audio_viz_bar.SetValue(int(volume * 100))
-                if self.audio_viz_text:
-                    self.audio_viz_text.SetLabel(f"{volume:.2f}")
-                
-                # change color based on threshold
-                if volume > self.audio_input.noise_threshold:
-                    self.audio_viz_bar.SetForegroundColour(wx.Colour(0, 255, 0))  # green when active
-                else:
-                    self.audio_viz_bar.SetForegroundColour(wx.Colour(100, 100, 100))  # gray when inactive
+                value = int(volume * 100)
+                text = f"{volume:.2f}"
+                active = volume > self.audio_input.noise_threshold
             else:
-                self.audio_viz_bar.SetValue(0)
-                if self.audio_viz_text:
-                    self.audio_viz_text.SetLabel("--")
+                value, text, active = 0, "--", None
+            
+            # only touch the widgets when something changed (each call repaints them)
+            if value != self._last_viz_value:
+                self._last_viz_value = value
+                self.audio_viz_bar.SetValue(value)
+            if self.audio_viz_text is not None and text != self._last_viz_text:
+                self._last_viz_text = text
+                self.audio_viz_text.SetLabel(text)
+            
+            # change color based on threshold (green when active, gray when not)
+            if active is not None and active != self._last_viz_active:
+                self._last_viz_active = active
+                self.audio_viz_bar.SetForegroundColour(VIZ_ACTIVE_COLOR if active else VIZ_IDLE_COLOR)
         except Exception as e:
-            logger.error(f"Error updating audio viz: {e}")
+            logger.error("Error updating audio viz: %s", e)
     
     def on_close(self, event):
-        # stop timers
-        if hasattr(self, 'key_timer'):
-            self.key_timer.Stop()
-        if hasattr(self, 'audio_viz_timer') and self.audio_viz_timer.IsRunning():
-            self.audio_viz_timer.Stop()
-        
+        wx.GetApp().Unbind(wx.EVT_KEY_UP, handler=self.on_key_up)
         if self.on_close_callback:
             self.on_close_callback()
         self.Destroy()
     
     def update_display(self, frame):
+        """
+        hand a new game frame to the display
+        
+        the frame is only remembered here; it is copied to the screen once the
+        GUI gets to it, so if several frames arrive before that only the
+        newest one is converted and painted
+        
+        errors are not caught here: they go to the game loop, which counts
+        them and stops the game if they keep happening. copying a frame to
+        the screen happens later (outside the game loop), so if that failed
+        the error is raised from the next update_display call instead
+        """
+        error, self._display_error = self._display_error, None
+        self._queue_frame(frame)
+        if error is not None:
+            raise error
+    
+    def _queue_frame(self, frame):
+        """remember the frame and schedule one copy to the screen"""
+        if self.game.game_state not in ('playing', 'paused', 'game_over'):
+            return
+        
+        if frame is None:
+            logger.warning("Received None frame, skipping display update")
+            return
+        
+        # piggyback the mic level on the game's frame cadence
+        now = time.perf_counter()
+        if now >= self._next_ui_poll:
+            playing = self.game.game_state == 'playing'
+            self._next_ui_poll = now + (UI_POLL_INTERVAL if playing else UI_IDLE_POLL_INTERVAL)
+            self.update_audio_viz()
+        
+        # the game loop doesn't draw while the window is minimized, so
+        # only the menu or the game over overlay can hide the display
+        if not self._bitmap_visible:
+            if self.game.game_state == 'game_over':
+                return  # the overlay covers the display, skip the frame
+            self.show_game_panel()
+        
+        self._pending_frame = frame
+        if not self._paint_scheduled:
+            self._paint_scheduled = True
+            wx.CallAfter(self._show_pending_frame)
+    
+    def _show_pending_frame(self):
+        """copy the newest frame into the display bitmap and repaint"""
+        self._paint_scheduled = False
+        frame, self._pending_frame = self._pending_frame, None
+        if frame is None or not self:  # nothing new, or the window is already closed
+            return
         try:
-            if self.game.game_state in ['playing', 'paused', 'game_over']:
-                if not self.game_panel.IsShown():
-                    self.show_game_panel()
-                
-                if frame is None:
-                    logger.warning("Received None frame, skipping display update")
-                    return
-                
-                height, width = frame.shape[:2]
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                wx_image = wx.Image(width, height)
-                wx_image.SetData(rgb_frame.tobytes())
-                bitmap = wx.Bitmap(wx_image)
-                self.display_bitmap.SetBitmap(bitmap)
-                self.display_bitmap.Refresh()
+            self.display_panel.show_frame(frame, rgb=self.renderer.rgb)
         except Exception as e:
-            logger.error(f"Error updating display: {e}", exc_info=True)
-
+            # not logged here - update_display hands it to the game loop's error handling
+            self._display_error = e
+    
+    def on_erase_background(self, event):
+        """skip background erasing for panels whose contents are painted over anyway"""
+        pass
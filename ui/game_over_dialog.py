@@ -27,7 +27,7 @@ class GameOverDialog(wx.Dialog):
             title_text = wx.StaticText(self, label="GAME OVER")
             title_text.SetForegroundColour(wx.Colour(255, 255, 255))
 
-        title_font = wx.Font(26, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
+        title_font = wx.TheFontList.FindOrCreateFont(26, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
         title_text.SetFont(title_font)
         main_sizer.Add(title_text, 0, wx.ALIGN_CENTER_HORIZONTAL, 0)
 
@@ -35,7 +35,7 @@ class GameOverDialog(wx.Dialog):
 
         score_text = wx.StaticText(self, label=f"Score: {score}")
         score_text.SetForegroundColour(wx.Colour(200, 200, 200))
-        score_font = wx.Font(18, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
+        score_font = wx.TheFontList.FindOrCreateFont(18, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
         score_text.SetFont(score_font)
         main_sizer.Add(score_text, 0, wx.ALIGN_CENTER_HORIZONTAL, 0)
 
@@ -43,14 +43,14 @@ class GameOverDialog(wx.Dialog):
 
         if is_high_score:
             self.name_entry = wx.TextCtrl(self, value=DEFAULT_NAME, size=(300, 38))
-            self.name_entry.SetFont(wx.Font(13, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
+            self.name_entry.SetFont(wx.TheFontList.FindOrCreateFont(13, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
             main_sizer.Add(self.name_entry, 0, wx.ALIGN_CENTER_HORIZONTAL, 0)
             main_sizer.AddSpacer(60)
         else:
             main_sizer.AddSpacer(60)
 
         ok_btn = wx.Button(self, label="OK", size=(130, 45))
-        ok_btn.SetFont(wx.Font(12, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
+        ok_btn.SetFont(wx.TheFontList.FindOrCreateFont(12, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
         ok_btn.Bind(wx.EVT_BUTTON, self.on_ok)
         main_sizer.Add(ok_btn, 0, wx.ALIGN_CENTER_HORIZONTAL, 0)
 
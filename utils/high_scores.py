@@ -30,6 +30,7 @@ class HighScoreManager:
         """create the high score manager and load existing scores"""
         self.scores_file = os.path.abspath(scores_file)
         self.scores = []  # list of {'name': str, 'score': int} dictionaries
+        self._top_text_cache = {}  # (count, name length) -> leaderboard text, cleared when scores change
         self.load_scores()
     
     def load_scores(self):
@@ -37,6 +38,7 @@ class HighScoreManager:
         load high scores from the JSON file
         if the file doesn't exist or is corrupted, start with an empty list
         """
+        self._clear_caches()
         if os.path.exists(self.scores_file):
             try:
                 with open(self.scores_file, 'r') as f:
@@ -84,13 +86,15 @@ class HighScoreManager:
         the score is inserted, then the list is sorted and trimmed
         to keep only the top MAX_SCORES_KEPT scores
         """
-        self.scores.append({'name': name, 'score': score})
+        scores = self.scores + [{'name': name, 'score': score}]
         
         # sort by score (highest first)
-        self.scores.sort(key=lambda x: x['score'], reverse=True)
+        scores.sort(key=lambda x: x['score'], reverse=True)
         
-        # keep only the top scores
-        self.scores = self.scores[:MAX_SCORES_KEPT]
+        # keep only the top scores (the in-memory list is always up to date,
+        # so nobody needs to reload the file after saving)
+        self.scores = scores[:MAX_SCORES_KEPT]
+        self._clear_caches()
         
         # save to disk
         self.save_scores()
@@ -99,6 +103,29 @@ class HighScoreManager:
         """get the top N scores (default: all stored scores)"""
         return self.scores[:count]
     
+    def get_top_scores_text(self, count, name_length):
+        """
+        get the top N scores as leaderboard text, one "rank name score" line each
+        
+        names are cut to name_length characters (the UI decides how much fits)
+        
+        the text is built once and reused until the scores change
+        (returns an empty string if there are no scores yet)
+        """
+        key = (count, name_length)
+        text = self._top_text_cache.get(key)
+        if text is None:
+            text = "\n".join(
+                f"{f'{i + 1}.':4} {s['name'][:name_length]:{name_length}} {s['score']:6}"
+                for i, s in enumerate(self.get_top_scores(count))
+            )
+            self._top_text_cache[key] = text
+        return text
+    
+    def _clear_caches(self):
+        """forget the cached leaderboard text (called whenever the scores change)"""
+        self._top_text_cache.clear()
+    
     def get_highest_score(self):
         """get the highest score ever achieved (returns 0 if no scores)"""
         if len(self.scores) == 0:
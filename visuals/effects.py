@@ -3,6 +3,8 @@ import numpy as np
 import random
 import logging
 
+from .themes import to_frame_color
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_PARTICLE_LIFETIME = 1.0
@@ -59,51 +61,79 @@ class ParticleSystem:
     def draw(self, frame):
         for particle in self.particles:
             if particle.is_alive():
-                alpha = 1.0 - (particle.age / particle.lifetime)
-                size = int(PARTICLE_BASE_SIZE * alpha)
-                if size > 0:
-                    cv2.circle(frame, 
-                             (int(particle.x), int(particle.y)), 
-                             size, 
-                             particle.color, 
-                             -1)
+                self._draw_particle(frame, particle)
+    
+    def step_and_draw(self, frame, delta_time=0.0, step_count=0):
+        # move and draw in one pass; only the first step_count particles are
+        # moved (the rest were spawned this frame and are drawn where they start)
+        survivors = []
+        for i, particle in enumerate(self.particles):
+            if i < step_count:
+                particle.update(delta_time)
+            if particle.is_alive():
+                survivors.append(particle)
+                self._draw_particle(frame, particle)
+        self.particles = survivors
+    
+    def _draw_particle(self, frame, particle):
+        alpha = 1.0 - (particle.age / particle.lifetime)
+        size = int(PARTICLE_BASE_SIZE * alpha)
+        if size > 0:
+            cv2.circle(frame, 
+                     (int(particle.x), int(particle.y)), 
+                     size, 
+                     particle.color, 
+                     -1)
     
     def clear(self):
         self.particles = []
 
 
 class VisualEffects:
-    def __init__(self, width, height):
+    def __init__(self, width, height, rgb=False):
         self.width = width
         self.height = height
+        self.rgb = rgb
         self.particle_system = ParticleSystem()
         self.flash_intensity = 0.0
         self.flash_color = (255, 255, 255)
         self.flash_decay_rate = FLASH_DECAY_RATE
+        self._flash_overlay = None  # reused solid-colour layer for the flash
     
     def trigger_goal_flash(self, player_left=True):
         self.flash_intensity = FLASH_MAX_INTENSITY
         if player_left:
-            self.flash_color = (0, 255, 0)
+            self.flash_color = to_frame_color((0, 255, 0), self.rgb)
         else:
-            self.flash_color = (255, 0, 0)
+            self.flash_color = to_frame_color((255, 0, 0), self.rgb)
     
     def trigger_collision_particles(self, x, y):
-        self.particle_system.add_explosion(x, y, count=COLLISION_PARTICLE_COUNT, color=(255, 255, 0))
+        self.particle_system.add_explosion(x, y, count=COLLISION_PARTICLE_COUNT,
+                                           color=to_frame_color((255, 255, 0), self.rgb))
+    
+    def is_idle(self):
+        # true when there is no flash or particle left to animate
+        return self.flash_intensity <= 0 and not self.particle_system.particles
     
     def update(self, delta_time):
+        self.update_flash(delta_time)
+        self.particle_system.update(delta_time)
+    
+    def update_flash(self, delta_time):
         if self.flash_intensity > 0:
             self.flash_intensity = max(0.0, self.flash_intensity - self.flash_decay_rate * delta_time)
-        self.particle_system.update(delta_time)
     
-    def apply_effects(self, frame):
+    def apply_effects(self, frame, delta_time=0.0, step_count=0):
         if self.flash_intensity > 0:
-            flash_overlay = np.zeros_like(frame)
+            if self._flash_overlay is None or self._flash_overlay.shape != frame.shape:
+                self._flash_overlay = np.empty_like(frame)
+            flash_overlay = self._flash_overlay
             flash_overlay[:] = self.flash_color
             alpha = self.flash_intensity * FLASH_ALPHA_MULTIPLIER
-            frame = cv2.addWeighted(frame, 1.0 - alpha, flash_overlay, alpha, 0)
+            # blend in place - the frame is overwritten with the flashed version
+            frame = cv2.addWeighted(frame, 1.0 - alpha, flash_overlay, alpha, 0, dst=frame)
         
-        self.particle_system.draw(frame)
+        self.particle_system.step_and_draw(frame, delta_time, step_count)
         return frame
     
     def apply_color_filter(self, frame, filter_type='hot'):
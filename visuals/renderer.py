@@ -15,7 +15,7 @@ import numpy as np  # numpy - numerical computing (used for image arrays)
 import logging
 
 from .effects import VisualEffects
-from .themes import get_theme, THEMES
+from .themes import get_theme, to_frame_color, THEMES
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +37,9 @@ PAUSED_TEXT_X_OFFSET = 100
 # general text thickness
 TEXT_THICKNESS = 2
 
+# theme colors that get drawn into the frame (stored as BGR in themes.py)
+FRAME_COLOR_KEYS = ('paddle', 'ball', 'center_line', 'score', 'bg_tint')
+
 
 class Renderer:
     """
@@ -50,14 +53,26 @@ class Renderer:
     - visual effects (flashes, particles, etc.)
     """
     
-    def __init__(self, width, height, theme_name='classic'):
-        """create a renderer for the given screen size"""
+    def __init__(self, width, height, theme_name='classic', rgb=False):
+        """
+        create a renderer for the given screen size
+        
+        rgb: draw frames in RGB channel order (what wx displays) instead of
+        OpenCV's usual BGR, so the UI doesn't have to convert every frame
+        """
         self.width = width
         self.height = height
+        self.rgb = rgb
         self.trail_enabled = False  # ball trail effect (not currently used)
-        self.effects = VisualEffects(width, height)  # particle effects system
+        self.effects = VisualEffects(width, height, rgb=rgb)  # particle effects system
         self.theme = get_theme(theme_name)  # current color theme
         self.theme_name = theme_name
+        self.colors = self._frame_colors(self.theme)  # theme colors in the frame's channel order
+        
+        # drawing buffers reused every frame (allocating ~1.4 MB per frame is slow)
+        self._background = np.empty((height, width, 3), dtype=np.uint8)  # plain theme background
+        self._overlay = np.empty((height, width, 3), dtype=np.uint8)  # layer the shapes are drawn on
+        self._background[:] = self.colors['bg_tint']
     
     def update_effects(self, delta_time):
         """update animated effects (fade out flashes, move particles, etc.)"""
@@ -82,9 +97,32 @@ class Renderer:
         """
         self.theme = get_theme(theme_name)
         self.theme_name = theme_name
+        self.colors = self._frame_colors(self.theme)
+        self._background[:] = self.colors['bg_tint']
         logger.info(f"Theme changed to: {theme_name}")
     
-    def render(self, game):
+    def _frame_colors(self, theme):
+        """the theme's drawing colors, converted once (not every frame)"""
+        return {key: to_frame_color(theme[key], self.rgb) for key in FRAME_COLOR_KEYS}
+    
+    def step_and_render(self, game, delta_time, out=None):
+        """
+        update effects, move the game forward and draw the frame - all in one call
+        
+        this does the same as update_effects() + game.update() + render(), but
+        particles are moved and drawn in a single loop instead of being walked
+        once to update them and again to draw them
+        """
+        self.effects.update_flash(delta_time)
+        
+        # particles that exist now get moved this frame; any spawned by
+        # game.update() (collisions) are drawn at their starting point
+        step_count = len(self.effects.particle_system.particles)
+        
+        game.update(delta_time)
+        return self.render(game, delta_time, step_count, out=out)
+    
+    def render(self, game, delta_time=0.0, step_count=0, out=None):
         """
         draw the entire game frame
         
@@ -94,35 +132,42 @@ class Renderer:
         3. draw the paddles and ball
         4. draw the score
         5. apply visual effects (flashes, particles)
-        6. return the final image
+        6. return the final image (RGB if the renderer was created with rgb=True)
+        
+        delta_time/step_count: used by step_and_render() to move the first
+        step_count particles while drawing them (leave at 0 to just draw)
+        
+        out: optional (height, width, 3) uint8 array to draw into. pass the same
+        array every frame to avoid allocating a new image each time
         
         returns: a numpy array (the image) that can be displayed on screen
         """
         try:
-            # create background with theme tint
-            bg_color = self.theme['bg_tint']
-            frame = np.full((self.height, self.width, 3), bg_color, dtype=np.uint8)
+            # the frame we draw into (a new one only if the caller didn't give us one)
+            if out is None:
+                out = np.empty((self.height, self.width, 3), dtype=np.uint8)
             
-            # create an overlay layer for drawing (allows transparency effects)
-            overlay = frame.copy()
+            # start the overlay layer from the theme background (allows transparency effects)
+            overlay = self._overlay
+            np.copyto(overlay, self._background)
             
             # draw the center line (dashed line down the middle)
             for y in range(0, self.height, CENTER_LINE_SPACING):
                 cv2.line(overlay, 
                          (self.width // 2, y),  # start point
                          (self.width // 2, min(y + CENTER_LINE_SEGMENT, self.height)),  # end point
-                         self.theme['center_line'],  # theme color
+                         self.colors['center_line'],  # theme color
                          2)  # line thickness
             
             # draw the paddles using theme colors
-            self._draw_paddle(overlay, game.paddle_left, self.theme['paddle'])
-            self._draw_paddle(overlay, game.paddle_right, self.theme['paddle'])
+            self._draw_paddle(overlay, game.paddle_left, self.colors['paddle'])
+            self._draw_paddle(overlay, game.paddle_right, self.colors['paddle'])
             
             # draw the ball using theme color
-            self._draw_ball(overlay, game.ball, self.theme['ball'])
+            self._draw_ball(overlay, game.ball, self.colors['ball'])
             
             # blend the overlay with the background (creates transparency effect)
-            frame = cv2.addWeighted(frame, 1 - OVERLAY_ALPHA, overlay, OVERLAY_ALPHA, 0)
+            frame = cv2.addWeighted(self._background, 1 - OVERLAY_ALPHA, overlay, OVERLAY_ALPHA, 0, dst=out)
             
             # draw the score (bounce count) at the top
             self._draw_bounces(frame, game.bounce_count)
@@ -134,7 +179,7 @@ class Renderer:
                               color=(255, 255, 255), scale=2)
             
             # apply visual effects (goal flashes, collision particles, etc.)
-            frame = self.effects.apply_effects(frame)
+            frame = self.effects.apply_effects(frame, delta_time, step_count)
             
             return frame
         
@@ -143,7 +188,7 @@ class Renderer:
             logger.error(f"Error in render: {e}", exc_info=True)
             error_frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
             cv2.putText(error_frame, "RENDER ERROR", (50, self.height // 2), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
+                       cv2.FONT_HERSHEY_SIMPLEX, 1, to_frame_color((255, 0, 0), self.rgb), 2)
             return error_frame
     
     def _draw_paddle(self, frame, paddle, color):
@@ -172,7 +217,7 @@ class Renderer:
         the text is centered by calculating its width
         """
         font = cv2.FONT_HERSHEY_SIMPLEX
-        color = self.theme['score']  # use theme color
+        color = self.colors['score']  # use theme color
         text = str(bounce_count)
         
         # calculate text size so we can center it
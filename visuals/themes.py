@@ -71,6 +71,15 @@ def get_theme(theme_name):
     return THEMES.get(theme_name, THEMES['classic'])
 
 
+def to_frame_color(bgr, rgb):
+    """
+    turn a BGR color into the channel order frames are drawn in
+    
+    rgb: True if frames are drawn in RGB (what wx displays), False for BGR
+    """
+    return bgr[::-1] if rgb else bgr
+
+
 def get_theme_names():
     """get a list of all available theme names"""
     return list(THEMES.keys())